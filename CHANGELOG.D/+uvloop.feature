@@ -0,0 +1 @@
+Run the CLI event loop on [uvloop](https://github.com/MagicStack/uvloop) when it is installed, e.g. via `pip install apolo-cli[uvloop]`.
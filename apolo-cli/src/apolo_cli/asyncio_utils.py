@@ -46,7 +46,7 @@ class Runner:
         assert not self._stopped
         self._started = True
         assert self._loop is None
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         self._loop.set_default_executor(self._executor)
         self._loop.set_debug(self._debug)
         if not self._debug:
@@ -77,6 +77,15 @@ class Runner:
         self._stopped = True
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    # uvloop is an optional speedup, use it if it is installed
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 def _exception_handler(
     loop: asyncio.AbstractEventLoop, context: dict[str, Any]
 ) -> None:
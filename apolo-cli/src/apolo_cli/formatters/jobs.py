@@ -422,15 +422,6 @@ class BaseJobsFormatter:
         pass
 
 
-class SimpleJobsFormatter(BaseJobsFormatter):
-    def __call__(self, jobs: Iterable[JobDescription]) -> RenderableType:
-        table = Table.grid()
-        table.add_column("")
-        for job in jobs:
-            table.add_row(job.id)
-        return table
-
-
 @dataclass(frozen=True)
 class TabularJobRow:
     id: str
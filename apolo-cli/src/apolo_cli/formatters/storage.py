@@ -464,18 +464,35 @@ class LongFilesFormatter(BaseFilesFormatter):
     def __init__(self, human_readable: bool, color: bool):
         self.human_readable = human_readable
         self.painter = get_painter(color)
+        # Large listings repeat the same sizes and timestamps a lot
+        # (empty files, bulk uploads), format each distinct value once.
+        self._sizes: dict[int, str] = {}
+        self._dates: dict[int, str] = {}
+
+    def _format_size(self, value: int) -> str:
+        size = self._sizes.get(value)
+        if size is None:
+            if self.human_readable:
+                size = format_size(value).rstrip("B")
+            else:
+                size = str(value)
+            self._sizes[value] = size
+        return size
+
+    def _format_date(self, value: int) -> str:
+        date = self._dates.get(value)
+        if date is None:
+            date = time.strftime(TIME_FORMAT, time.localtime(value))
+            self._dates[value] = date
+        return date
 
     def _columns_for_file(self, file: FileStatus) -> Sequence[RenderableType]:
 
         type = self.file_types_mapping[file.type]
         permission = self.permissions_mapping[file.permission]
 
-        date = time.strftime(TIME_FORMAT, time.localtime(file.modification_time))
-
-        if self.human_readable:
-            size = format_size(file.size).rstrip("B")
-        else:
-            size = str(file.size)
+        date = self._format_date(file.modification_time)
+        size = self._format_size(file.size)
 
         name = self.painter.paint(file.name, file.type)
         if file.target is not None:
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 import re
@@ -26,6 +27,8 @@ from .utils import argument, command, format_size, group, option
 
 log = logging.getLogger(__name__)
 
+MAX_CONCURRENT_TAG_REQUESTS = 10
+
 
 @group()
 def image() -> None:
@@ -216,15 +219,26 @@ async def tags(root: Root, format_long: bool, image: RemoteImage) -> None:
     if format_long:
         with Progress() as progress:
             task = progress.add_task("Getting image sizes...", total=len(tags_list))
-            tags_with_sizes = []
-            for tag in tags_list:
-                tag_with_size = await root.client.images.tag_info(
-                    replace(image, tag=tag.name)
-                )
+
+            sem = asyncio.BoundedSemaphore(MAX_CONCURRENT_TAG_REQUESTS)
+
+            async def _tag_info(tag: Tag) -> Tag:
+                async with sem:
+                    tag_with_size = await root.client.images.tag_info(
+                        replace(image, tag=tag.name)
+                    )
                 progress.update(task, advance=1)
-                tags_with_sizes.append(tag_with_size)
+                return tag_with_size
+
+            tasks = [asyncio.ensure_future(_tag_info(tag)) for tag in tags_list]
+            try:
+                tags_list = await asyncio.gather(*tasks)
+            finally:
+                # Don't leave requests running if the command fails
+                for t in tasks:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
         formatter = LongTagsFormatter()
-        tags_list = tags_with_sizes
     else:
         formatter = ShortTagsFormatter()
     with root.pager():
@@ -5,7 +5,7 @@ import logging
 import shlex
 import sys
 import webbrowser
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import AsyncExitStack
 from datetime import datetime, timedelta, timezone
 
@@ -48,12 +48,10 @@ from .click_types import (
 from .const import EX_PLATFORMERROR
 from .formatters.images import DockerImageProgress
 from .formatters.jobs import (
-    BaseJobsFormatter,
     JobStartProgress,
     JobStatusFormatter,
     JobTelemetryFormatter,
     LifeSpanUpdateFormatter,
-    SimpleJobsFormatter,
     TabularJobsFormatter,
 )
 from .formatters.utils import (
@@ -93,6 +91,9 @@ DEFAULT_JOB_LIFE_SPAN = "1d"
 
 TOP_REFRESH_DELAY = 0.2
 TOP_NEW_JOBS_DELAY = 3
+JOB_STATUS_POLL_DELAY = 0.2
+JOB_STATUS_POLL_MAX_DELAY = 2.0
+MAX_CONCURRENT_KILLS = 10
 
 
 TTY_OPT = option(
@@ -268,8 +269,9 @@ async def attach(root: Root, job: str, port_forward: list[tuple[int, int]]) -> N
     if status.status.is_pending:
         with JobStartProgress.create(root.console, quiet=root.quiet) as progress:
             progress.step(status)
+            delays = _poll_delays()
             while status.status.is_pending:
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(next(delays))
                 status = await root.client.jobs.status(id)
                 progress.step(status)
 
@@ -422,8 +424,6 @@ async def ls(
     apolo ps -t tag1 -t tag2
     """
 
-    format = await calc_ps_columns(root.client, format)
-
     statuses = calc_statuses(status, all)
     owners = set(owner)
     if "ME" in owners:
@@ -443,18 +443,17 @@ async def ls(
     else:
         project_names = project or [root.client.config.project_name_or_raise]
 
-    uri_fmtr: URIFormatter
-    if full_uri:
-        uri_fmtr = str
-    else:
-        uri_fmtr = uri_formatter(
-            project_name=root.client.config.project_name_or_raise,
-            cluster_name=root.client.cluster_name,
-            org_name=root.client.config.org_name,
-        )
-    if root.quiet:
-        formatter: BaseJobsFormatter = SimpleJobsFormatter()
-    else:
+    if not root.quiet:
+        format = await calc_ps_columns(root.client, format)
+        uri_fmtr: URIFormatter
+        if full_uri:
+            uri_fmtr = str
+        else:
+            uri_fmtr = uri_formatter(
+                project_name=root.client.config.project_name_or_raise,
+                cluster_name=root.client.cluster_name,
+                org_name=root.client.config.org_name,
+            )
         image_fmtr = image_formatter(uri_formatter=uri_fmtr)
         formatter = TabularJobsFormatter(
             root.client.username,
@@ -494,6 +493,13 @@ async def ls(
 
             jobs = _filter_distinct(jobs)
 
+        if root.quiet:
+            # Job IDs don't need column alignment, print them as they arrive
+            # so that piping into head/xargs doesn't wait for the whole list.
+            async for job in jobs:
+                root.print(job.id)
+            return
+
         with root.status("Fetching jobs") as rich_status:
             jobs_list = []
             async for job in jobs:
@@ -843,19 +849,37 @@ async def kill(root: Root, jobs: Sequence[str]) -> None:
     """
     Kill job(s).
     """
+
+    sem = asyncio.BoundedSemaphore(MAX_CONCURRENT_KILLS)
+
+    async def _kill(job: str) -> tuple[str, str, Exception | None]:
+        async with sem:
+            job_resolved = await resolve_job(
+                job, client=root.client, status=JobStatus.active_items()
+            )
+            try:
+                await root.client.jobs.kill(job_resolved)
+            except ValueError as e:
+                return job, job_resolved, e
+            except AuthorizationError:
+                return job, job_resolved, ValueError(f"Not enough permissions")
+            return job, job_resolved, None
+
+    tasks = [asyncio.ensure_future(_kill(job)) for job in jobs]
     errors = []
-    for job in jobs:
-        job_resolved = await resolve_job(
-            job, client=root.client, status=JobStatus.active_items()
-        )
-        try:
-            await root.client.jobs.kill(job_resolved)
-            # TODO (ajuszkowski) printing should be on the cli level
-            root.print(job_resolved)
-        except ValueError as e:
-            errors.append((job, e))
-        except AuthorizationError:
-            errors.append((job, ValueError(f"Not enough permissions")))
+    try:
+        for fut in asyncio.as_completed(tasks):
+            job, job_resolved, error = await fut
+            if error is None:
+                # TODO (ajuszkowski) printing should be on the cli level
+                root.print(job_resolved)
+            else:
+                errors.append((job, error))
+    finally:
+        # Don't leave requests running if the command fails
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     for job, error in errors:
         root.print(f"Cannot kill job {job}: {error}", err=True, style="red")
@@ -1154,7 +1178,7 @@ async def run(
     cluster_config = root.client.config.clusters[cluster_name]
     if not preset:
         preset = next(iter(cluster_config.presets.keys()))
-    log.info(f"Using preset '{preset}'")
+    log.info("Using preset '%s'", preset)
     if tty is None:
         tty = root.tty
     await run_job(
@@ -1281,27 +1305,27 @@ async def run_job(
         _check_tty(root, tty)
 
     job_restart_policy = JobRestartPolicy(restart)
-    log.debug(f"Job restart policy: {job_restart_policy}")
+    log.debug("Job restart policy: %s", job_restart_policy)
 
     job_life_span = await calc_life_span(
         root.client, life_span, DEFAULT_JOB_LIFE_SPAN, "job"
     )
-    log.debug(f"Job run-time limit: {job_life_span}")
+    log.debug("Job run-time limit: %s", job_life_span)
 
     if schedule_timeout is None:
         job_schedule_timeout = None
     else:
         job_schedule_timeout = parse_timedelta(schedule_timeout).total_seconds()
-    log.debug(f"Job schedule timeout: {job_schedule_timeout}")
+    log.debug("Job schedule timeout: %s", job_schedule_timeout)
 
     env_parse_result = root.client.parse.envs(env, env_file, cluster_name=cluster_name)
     env_dict, secret_env_dict = env_parse_result.env, env_parse_result.secret_env
     real_cmd = _parse_cmd(cmd)
 
-    log.debug(f'entrypoint="{entrypoint}"')
-    log.debug(f'cmd="{real_cmd}"')
+    log.debug('entrypoint="%s"', entrypoint)
+    log.debug('cmd="%s"', real_cmd)
 
-    log.info(f"Using image '{image}'")
+    log.info("Using image '%s'", image)
 
     volume_parse_result = root.client.parse.volumes(volume, cluster_name=cluster_name)
     volumes = list(volume_parse_result.volumes)
@@ -1371,8 +1395,9 @@ async def run_job(
         await root.client.users.share(user, permission)
     with JobStartProgress.create(console=root.console, quiet=root.quiet) as progress:
         progress.begin(job)
+        delays = _poll_delays()
         while wait_start and job.status.is_pending:
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(next(delays))
             job = await root.client.jobs.status(job.id)
             progress.step(job)
         progress.end(job)
@@ -1480,6 +1505,15 @@ def _check_tty(root: Root, tty: bool) -> None:
         )
 
 
+def _poll_delays() -> Iterator[float]:
+    # Back off exponentially while a job stays pending to keep
+    # the number of status requests low for slow-starting jobs.
+    delay = JOB_STATUS_POLL_DELAY
+    while True:
+        yield delay
+        delay = min(delay * 1.5, JOB_STATUS_POLL_MAX_DELAY)
+
+
 def _job_to_cli_args(job: JobDescription) -> list[str]:
     res = []
     if job.preset_name:
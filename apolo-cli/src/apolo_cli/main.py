@@ -289,6 +289,9 @@ class MainGroup(Group):
             for name in CMD_MAP:
                 self._pre_load(name)
         else:
+            if name in self.commands:
+                # already loaded, don't rebuild the alias wrappers
+                return
             path = CMD_MAP.get(name)
             if path is None:
                 return
@@ -560,13 +563,49 @@ async def help(root: Root, command: Sequence[str]) -> None:
             ctx.close()
 
 
-def _err_to_str(err: Exception) -> str:
+def _err_to_str(err: BaseException) -> str:
     result = str(err)
     if result == "":
         result = type(err).__name__
     return result
 
 
+# Ordered from the most specific to the most generic exception type,
+# the first matching entry wins.
+_ERROR_HANDLERS: dict[type[BaseException], tuple[int, str]] = {
+    asyncio.TimeoutError: (EX_TIMEOUT, "Timeout"),
+    apolo_sdk.IllegalArgumentError: (EX_DATAERR, "Illegal argument(s) ({msg})"),
+    apolo_sdk.ResourceNotFound: (EX_OSFILE, "{msg}"),
+    apolo_sdk.AuthenticationError: (EX_NOPERM, "Cannot authenticate ({msg})"),
+    apolo_sdk.AuthorizationError: (EX_NOPERM, "Not enough permissions ({msg})"),
+    apolo_sdk.ClientError: (EX_SOFTWARE, "Application error ({msg})"),
+    apolo_sdk.BadGateway: (EX_PLATFORMERROR, "Application error ({msg})"),
+    apolo_sdk.ConfigError: (EX_SOFTWARE, "{msg}"),
+    aiohttp.ClientError: (EX_IOERR, "Connection error ({msg})"),
+    DockerError: (EX_PROTOCOL, "Docker API error: {error.message}"),
+    apolo_sdk.NotSupportedError: (EX_SOFTWARE, "{msg}"),
+    NotImplementedError: (EX_SOFTWARE, "{msg}"),
+    FileNotFoundError: (EX_OSFILE, "File not found ({msg})"),
+    NotADirectoryError: (EX_OSFILE, "{msg}"),
+    PermissionError: (EX_NOPERM, "Cannot access file ({msg})"),
+    OSError: (EX_IOERR, "I/O Error ({msg})"),
+    asyncio.CancelledError: (130, "Cancelled"),
+    KeyboardInterrupt: (130, "Aborting."),
+    ValueError: (127, "{msg}"),
+}
+_ERROR_TYPES = tuple(_ERROR_HANDLERS)
+
+
+def _find_error_handler(error: BaseException) -> tuple[int, str]:
+    handler = _ERROR_HANDLERS.get(type(error))
+    if handler is not None:
+        return handler
+    for err_type, handler in _ERROR_HANDLERS.items():
+        if isinstance(error, err_type):
+            return handler
+    raise AssertionError(f"Unhandled error type {type(error)!r}")  # pragma: no cover
+
+
 def main(args: list[str] | None = None) -> None:
     setup_shell_completion()
 
@@ -587,80 +626,10 @@ def main(args: list[str] | None = None) -> None:
     except ClickExit as e:
         sys.exit(e.exit_code)
 
-    except asyncio.TimeoutError:
-        log.exception("Timeout")
-        sys.exit(EX_TIMEOUT)
-
-    except apolo_sdk.IllegalArgumentError as error:
-        log.exception(f"Illegal argument(s) ({_err_to_str(error)})")
-        sys.exit(EX_DATAERR)
-
-    except apolo_sdk.ResourceNotFound as error:
-        log.exception(f"{_err_to_str(error)}")
-        sys.exit(EX_OSFILE)
-
-    except apolo_sdk.AuthenticationError as error:
-        log.exception(f"Cannot authenticate ({_err_to_str(error)})")
-        sys.exit(EX_NOPERM)
-    except apolo_sdk.AuthorizationError as error:
-        log.exception(f"Not enough permissions ({_err_to_str(error)})")
-        sys.exit(EX_NOPERM)
-
-    except apolo_sdk.ClientError as error:
-        log.exception(f"Application error ({_err_to_str(error)})")
-        sys.exit(EX_SOFTWARE)
-
-    except apolo_sdk.BadGateway as error:
-        log.exception(f"Application error ({_err_to_str(error)})")
-        sys.exit(EX_PLATFORMERROR)
-
-    except apolo_sdk.ConfigError as error:
-        log.exception(f"{_err_to_str(error)}")
-        sys.exit(EX_SOFTWARE)
-
-    except aiohttp.ClientError as error:
-        log.exception(f"Connection error ({_err_to_str(error)})")
-        sys.exit(EX_IOERR)
-
-    except DockerError as error:
-        log.exception(f"Docker API error: {error.message}")
-        sys.exit(EX_PROTOCOL)
-
-    except apolo_sdk.NotSupportedError as error:
-        log.exception(f"{_err_to_str(error)}")
-        sys.exit(EX_SOFTWARE)
-
-    except NotImplementedError as error:
-        log.exception(f"{_err_to_str(error)}")
-        sys.exit(EX_SOFTWARE)
-
-    except FileNotFoundError as error:
-        log.exception(f"File not found ({_err_to_str(error)})")
-        sys.exit(EX_OSFILE)
-
-    except NotADirectoryError as error:
-        log.exception(f"{_err_to_str(error)}")
-        sys.exit(EX_OSFILE)
-
-    except PermissionError as error:
-        log.exception(f"Cannot access file ({_err_to_str(error)})")
-        sys.exit(EX_NOPERM)
-
-    except OSError as error:
-        log.exception(f"I/O Error ({_err_to_str(error)})")
-        sys.exit(EX_IOERR)
-
-    except asyncio.CancelledError:
-        log.exception("Cancelled")
-        sys.exit(130)
-
-    except KeyboardInterrupt:
-        log.exception("Aborting.")
-        sys.exit(130)
-
-    except ValueError as e:
-        log.exception(_err_to_str(e))
-        sys.exit(127)
+    except _ERROR_TYPES as error:
+        code, template = _find_error_handler(error)
+        log.exception(template.format(msg=_err_to_str(error), error=error))
+        sys.exit(code)
 
     except SystemExit:
         raise
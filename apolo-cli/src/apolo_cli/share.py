@@ -53,7 +53,7 @@ async def grant(root: Root, uri: str, user: str, permission: str) -> None:
         uri_obj = parse_resource_for_sharing(uri, root)
         action_obj = parse_permission_action(permission)
         permission_obj = Permission(uri=uri_obj, action=action_obj)
-        log.info(f"Using resource '{permission_obj.uri}'")
+        log.info("Using resource '%s'", permission_obj.uri)
 
         actual_permission = await root.client.users.share(user, permission_obj)
 
@@ -91,7 +91,7 @@ async def revoke(root: Root, uri: str, user: str) -> None:
     """
     try:
         uri_obj = parse_resource_for_sharing(uri, root)
-        log.info(f"Using resource '{uri_obj}'")
+        log.info("Using resource '%s'", uri_obj)
 
         await root.client.users.revoke(user, uri_obj)
 
@@ -130,8 +130,22 @@ class Context(click.Context):
         )
 
 
+_EXAMPLES_RE = re.compile("Example[s]:\n", flags=re.IGNORECASE)
+
+
 def split_examples(help: str) -> list[str]:
-    return re.split("Example[s]:\n", help, flags=re.IGNORECASE)
+    return _EXAMPLES_RE.split(help)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_help(help: str) -> tuple[str, tuple[str, ...]] | None:
+    # Command help strings are static, parse every docstring only once
+    help = textwrap.dedent(help)
+    if not help:
+        return None
+    help = inspect.cleandoc(help).partition("\f")[0]
+    help_text, *examples = split_examples(help)
+    return help_text, tuple(example.strip() for example in examples)
 
 
 def format_example(example: str, formatter: click.HelpFormatter) -> None:
@@ -192,17 +206,15 @@ class ApoloClickMixin:
         """Writes the help text to the formatter if it exists."""
         deprecated = self.deprecated  # type: ignore
         help = self.help  # type: ignore
-        help = help and textwrap.dedent(help)
-        if help:
-            help = inspect.cleandoc(help).partition("\f")[0]
-            help_text, *examples = split_examples(help)
+        parsed = _parse_help(help) if help else None
+        if parsed is not None:
+            help_text, examples = parsed
             if help_text:
                 formatter.write_paragraph()
                 with formatter.indentation():
                     if deprecated:
                         help_text += DEPRECATED_HELP_NOTICE
                     formatter.write_text(help_text)
-            examples = [example.strip() for example in examples]
 
             for example in examples:
                 format_example(example, formatter)
@@ -493,7 +505,9 @@ async def resolve_job_ex(
                     job.project_name in project_names
                     and job.org_name == project_names[job.project_name]
                 ):
-                    log.debug(f"Job name '{id_or_name}' resolved to job ID '{job.id}'")
+                    log.debug(
+                        "Job name '%s' resolved to job ID '%s'", id_or_name, job.id
+                    )
                     return job.id, cluster_name
     except asyncio.CancelledError:
         raise
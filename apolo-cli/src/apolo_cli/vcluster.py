@@ -154,7 +154,7 @@ async def create_service_account(
         sa_ttl = root.client.vcluster.DEFAULT_TTL
     else:
         sa_ttl = parse_timedelta(ttl)
-    log.debug(f"TTL: {sa_ttl}")
+    log.debug("TTL: %s", sa_ttl)
     await root.client.vcluster.create_service_account(
         name,
         cluster_name=cluster,
@@ -254,7 +254,7 @@ async def regenerate_service_account(
         sa_ttl = root.client.vcluster.DEFAULT_TTL
     else:
         sa_ttl = parse_timedelta(ttl)
-    log.debug(f"TTL: {sa_ttl}")
+    log.debug("TTL: %s", sa_ttl)
     await root.client.vcluster.regenerate_service_account(
         name,
         cluster_name=cluster,
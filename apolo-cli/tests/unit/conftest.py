@@ -299,11 +299,6 @@ def run_cli(
     return _run_cli
 
 
-@pytest.fixture()
-def click_tty_emulation(monkeypatch: Any) -> None:
-    monkeypatch.setattr("click._compat.isatty", lambda stream: True)
-
-
 @dataclasses.dataclass(eq=False)
 class Guard:
     arg: str
@@ -45,7 +45,7 @@ def test_bucket_formatter_with_org(rich_cmp: Any) -> None:
     rich_cmp(fmtr(bucket))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def buckets_list() -> list[Bucket]:
     return [
         Bucket(
@@ -32,7 +32,7 @@ def test_disk_formatter(rich_cmp: Any) -> None:
     rich_cmp(fmtr(disk))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def disks_list() -> list[Disk]:
     return [
         Disk(
@@ -36,7 +36,6 @@ from apolo_cli.formatters.jobs import (
     JobStopProgress,
     JobTelemetryFormatter,
     LifeSpanUpdateFormatter,
-    SimpleJobsFormatter,
     TabularJobRow,
     TabularJobsFormatter,
     format_timedelta,
@@ -93,7 +92,7 @@ def new_console() -> _NewConsole:
     return factory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_descr_no_name() -> JobDescription:
     return JobDescription(
         status=JobStatus.PENDING,
@@ -123,7 +122,7 @@ def job_descr_no_name() -> JobDescription:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def job_descr() -> JobDescription:
     return JobDescription(
         status=JobStatus.PENDING,
@@ -265,7 +264,7 @@ class TestJobStartProgress:
             progress.begin(make_job(JobStatus.PENDING, "", name="job-name"))
             rich_cmp(console)
 
-    @pytest.mark.parametrize("status", JobStatus.items())
+    @pytest.mark.parametrize("status", sorted(JobStatus.items()))
     def test_tty_step(
         self,
         rich_cmp: Any,
@@ -286,7 +285,7 @@ class TestJobStartProgress:
             progress.step(make_job(status, "reason", description=""))
             rich_cmp(console)
 
-    @pytest.mark.parametrize("status", JobStatus.items())
+    @pytest.mark.parametrize("status", sorted(JobStatus.items()))
     def test_tty_end(
         self, rich_cmp: Any, new_console: _NewConsole, status: JobStatus
     ) -> None:
@@ -323,7 +322,7 @@ class TestJobStopProgress:
             progress.step(make_job(JobStatus.RUNNING, ""))
             rich_cmp(console)
 
-    @pytest.mark.parametrize("status", JobStatus.finished_items())
+    @pytest.mark.parametrize("status", sorted(JobStatus.finished_items()))
     def test_no_tty_end(
         self, rich_cmp: Any, new_console: _NewConsole, status: JobStatus
     ) -> None:
@@ -332,7 +331,7 @@ class TestJobStopProgress:
             progress.end(make_job(status, "reason"))
             rich_cmp(console)
 
-    @pytest.mark.parametrize("status", JobStatus.active_items())
+    @pytest.mark.parametrize("status", sorted(JobStatus.active_items()))
     def test_tty_step(
         self,
         rich_cmp: Any,
@@ -353,7 +352,7 @@ class TestJobStopProgress:
             rich_cmp(console)
             progress.step(make_job(JobStatus.RUNNING, "", description=""))
 
-    @pytest.mark.parametrize("status", JobStatus.finished_items())
+    @pytest.mark.parametrize("status", sorted(JobStatus.finished_items()))
     def test_tty_end(
         self, rich_cmp: Any, new_console: _NewConsole, status: JobStatus
     ) -> None:
@@ -1940,71 +1939,6 @@ class TestJobStatusFormatter:
             assert format_timedelta(delta)
 
 
-class TestSimpleJobsFormatter:
-    def test_empty(self, rich_cmp: Any) -> None:
-        formatter = SimpleJobsFormatter()
-        rich_cmp(formatter([]))
-
-    def test_list(self, rich_cmp: Any) -> None:
-        jobs = [
-            JobDescription(
-                status=JobStatus.PENDING,
-                id="job-42687e7c-6c76-4857-a6a7-1166f8295391",
-                project_name="myproject",
-                owner="owner",
-                cluster_name="default",
-                org_name="my_org",
-                namespace="",
-                uri=URL("job://default/owner/job-42687e7c-6c76-4857-a6a7-1166f8295391"),
-                history=JobStatusHistory(
-                    status=JobStatus.PENDING,
-                    reason="ErrorReason",
-                    description="ErrorDesc",
-                    created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-                    resources=Resources(memory=16 * 2**20, cpu=0.1, shm=False),
-                ),
-                scheduler_enabled=True,
-                pass_config=True,
-                total_price_credits=Decimal("150"),
-                price_credits_per_hour=Decimal("15"),
-            ),
-            JobDescription(
-                status=JobStatus.PENDING,
-                id="job-cf33bd55-9e3b-4df7-a894-9c148a908a66",
-                name="this-job-has-a-name",
-                project_name="otherproject",
-                owner="owner",
-                cluster_name="default",
-                org_name="my_org",
-                namespace="",
-                uri=URL("job://default/owner/job-cf33bd55-9e3b-4df7-a894-9c148a908a66"),
-                history=JobStatusHistory(
-                    status=JobStatus.FAILED,
-                    reason="ErrorReason",
-                    description="ErrorDesc",
-                    created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-                    resources=Resources(memory=16 * 2**20, cpu=0.1, shm=False),
-                ),
-                scheduler_enabled=True,
-                pass_config=True,
-                total_price_credits=Decimal("150"),
-                price_credits_per_hour=Decimal("15"),
-            ),
-        ]
-        formatter = SimpleJobsFormatter()
-        rich_cmp(formatter(jobs))
-
-
 class TestTabularJobRow:
     def _job_descr_with_status(
         self,
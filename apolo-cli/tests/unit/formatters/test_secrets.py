@@ -7,7 +7,7 @@ from apolo_sdk import Secret
 from apolo_cli.formatters.secrets import SecretsFormatter, SimpleSecretsFormatter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def secrets_list() -> list[Secret]:
     return [
         Secret(
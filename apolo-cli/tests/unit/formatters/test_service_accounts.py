@@ -32,7 +32,7 @@ def test_service_account_formatter(rich_cmp: Any, org: Any) -> None:
     rich_cmp(fmtr(account))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_accounts_list() -> list[ServiceAccount]:
     return [
         ServiceAccount(
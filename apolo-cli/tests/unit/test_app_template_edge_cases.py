@@ -1,6 +1,7 @@
+import os
 import tempfile
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 from unittest import mock
 
@@ -140,20 +141,12 @@ def test_app_template_get_quiet_mode_with_file(run_cli: _RunCli) -> None:
             content = f.read()
             assert "template_name: test-app" in content
     finally:
-        import os
-
         if os.path.exists(temp_path):
             os.unlink(temp_path)
 
 
 def test_app_template_ls_with_cluster_option(run_cli: _RunCli) -> None:
     """Test the app_template ls command with cluster option."""
-    from collections.abc import AsyncIterator
-    from contextlib import asynccontextmanager
-
-    from apolo_sdk import AppTemplate
-    from apolo_sdk._apps import Apps
-
     templates = [
         AppTemplate(
             name="test-app",
@@ -190,12 +183,6 @@ def test_app_template_ls_with_cluster_option(run_cli: _RunCli) -> None:
 
 def test_app_template_ls_with_org_and_project_options(run_cli: _RunCli) -> None:
     """Test the app_template ls command with org and project options."""
-    from collections.abc import AsyncIterator
-    from contextlib import asynccontextmanager
-
-    from apolo_sdk import AppTemplate
-    from apolo_sdk._apps import Apps
-
     templates = [
         AppTemplate(
             name="org-app",
@@ -308,7 +295,5 @@ def test_app_template_get_with_all_options(run_cli: _RunCli) -> None:
             assert '"template_version": "3.0.0"' in content
             assert '"param1": "test"' in content
     finally:
-        import os
-
         if os.path.exists(temp_path):
             os.unlink(temp_path)
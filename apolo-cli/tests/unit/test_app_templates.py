@@ -1,3 +1,4 @@
+import os
 import tempfile
 from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager, contextmanager
@@ -410,8 +411,6 @@ def test_app_template_get_with_file_output(run_cli: _RunCli) -> None:
             assert "template_name: test-app" in content
             assert "template_version: 1.0.0" in content
     finally:
-        import os
-
         if os.path.exists(temp_path):
             os.unlink(temp_path)
 
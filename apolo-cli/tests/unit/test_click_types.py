@@ -5,8 +5,8 @@ import pytest
 
 from apolo_cli.click_types import (
     JOB_NAME,
+    LOCAL_REMOTE_PORT,
     NVIDIA_MIG,
-    LocalRemotePortParamType,
     NvidiaMIG,
     PlatformURIType,
     _merge_autocompletion_args,
@@ -19,8 +19,7 @@ from apolo_cli.root import Root
     [("1:1", (1, 1)), ("1:10", (1, 10)), ("434:1", (434, 1)), ("0897:123", (897, 123))],
 )
 def test_local_remote_port_param_type_valid(arg: str, val: tuple[int, int]) -> None:
-    param = LocalRemotePortParamType()
-    assert param.convert(arg, None, None) == val
+    assert LOCAL_REMOTE_PORT.convert(arg, None, None) == val
 
 
 @pytest.mark.parametrize(
@@ -38,9 +37,8 @@ def test_local_remote_port_param_type_valid(arg: str, val: tuple[int, int]) -> N
     ],
 )
 def test_local_remote_port_param_type_invalid(arg: str) -> None:
-    param = LocalRemotePortParamType()
     with pytest.raises(click.BadParameter, match=".* is not a valid port combination"):
-        param.convert(arg, None, None)
+        LOCAL_REMOTE_PORT.convert(arg, None, None)
 
 
 class TestJobNameType:
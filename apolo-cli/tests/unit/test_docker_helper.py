@@ -32,7 +32,7 @@ _RunDch = Callable[[list[str]], SysCapWithCode]
 
 
 @pytest.fixture()
-def run_dch(capfd: Any, monkeypatch: Any, tmp_path: Path, nmrc_path: Path) -> _RunDch:
+def run_dch(capsys: Any, monkeypatch: Any, tmp_path: Path, nmrc_path: Path) -> _RunDch:
     def _run_dch(arguments: list[str]) -> SysCapWithCode:
 
         log.info("Run 'docker-helper-apolo %s'", " ".join(arguments))
@@ -44,7 +44,7 @@ def run_dch(capfd: Any, monkeypatch: Any, tmp_path: Path, nmrc_path: Path) -> _R
                 dch()
         except SystemExit as e:
             code = e.code  # type: ignore
-        out, err = capfd.readouterr()
+        out, err = capsys.readouterr()
         return SysCapWithCode(out.strip(), err.strip(), code)
 
     return _run_dch
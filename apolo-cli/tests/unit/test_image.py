@@ -0,0 +1,69 @@
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+from click.testing import CliRunner
+
+from apolo_sdk import RemoteImage, Tag
+
+from apolo_cli.image import MAX_CONCURRENT_TAG_REQUESTS, tags
+from apolo_cli.root import Root
+
+
+def _mock_tags(root: Root, tag_names: list[str]) -> None:
+    async def _tags(image: RemoteImage) -> list[RemoteImage]:
+        return [replace(image, tag=name) for name in tag_names]
+
+    root.client.images.tags = AsyncMock(side_effect=_tags)  # type: ignore
+
+
+def test_tags_long_keeps_order_and_limits_concurrency(root: Root) -> None:
+    tag_names = [f"tag-{i:02d}" for i in range(25)]
+    running = 0
+    max_running = 0
+
+    async def _tag_info(image: RemoteImage) -> Tag:
+        nonlocal running, max_running
+        assert image.tag is not None
+        index = tag_names.index(image.tag)
+        running += 1
+        max_running = max(max_running, running)
+        # later tags complete first
+        await asyncio.sleep(0.001 * (len(tag_names) - index))
+        running -= 1
+        return Tag(name=image.tag, size=(index + 1) * 1024)
+
+    _mock_tags(root, tag_names)
+    root.client.images.tag_info = AsyncMock(side_effect=_tag_info)  # type: ignore
+
+    result = CliRunner().invoke(tags, ["-l", "image:myimage"], obj=root)
+
+    assert result.exit_code == 0, result.output
+    assert root.client.images.tag_info.await_count == len(tag_names)
+    assert max_running == MAX_CONCURRENT_TAG_REQUESTS
+    positions = [result.output.index(name) for name in tag_names]
+    assert positions == sorted(positions)
+
+
+def test_tags_long_cancels_pending_requests_on_error(root: Root) -> None:
+    tag_names = [f"tag-{i:02d}" for i in range(3)]
+    cancelled = []
+
+    async def _tag_info(image: RemoteImage) -> Tag:
+        assert image.tag is not None
+        if image.tag == tag_names[0]:
+            raise RuntimeError("Unexpected")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(image.tag)
+            raise
+        raise AssertionError("unreachable")
+
+    _mock_tags(root, tag_names)
+    root.client.images.tag_info = AsyncMock(side_effect=_tag_info)  # type: ignore
+
+    result = CliRunner().invoke(tags, ["-l", "image:myimage"], obj=root)
+
+    assert isinstance(result.exception, RuntimeError)
+    assert sorted(cancelled) == tag_names[1:]
@@ -1,12 +1,18 @@
+import asyncio
+import contextlib
+import itertools
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 import toml
+from click.testing import CliRunner
 from dateutil.parser import isoparse
 from yarl import URL
 
@@ -27,11 +33,17 @@ from apolo_sdk import (
 )
 
 from apolo_cli.job import (
+    JOB_STATUS_POLL_DELAY,
+    JOB_STATUS_POLL_MAX_DELAY,
+    MAX_CONCURRENT_KILLS,
     _job_to_cli_args,
     _parse_cmd,
+    _poll_delays,
     calc_ps_columns,
     calc_statuses,
     calc_top_columns,
+    kill,
+    ls,
 )
 from apolo_cli.parse_utils import (
     PS_COLUMNS_MAP,
@@ -536,3 +548,89 @@ def test_job_to_args_no_cmd() -> None:
         "proj",
         "test-image",
     ]
+
+
+def test_poll_delays() -> None:
+    delays = list(itertools.islice(_poll_delays(), 20))
+    assert delays[0] == JOB_STATUS_POLL_DELAY
+    assert delays == sorted(delays)
+    assert delays[-1] == JOB_STATUS_POLL_MAX_DELAY
+
+
+def test_kill_multiple_jobs(root: Root) -> None:
+    job_ids = [f"job-{i:08d}-0000-0000-0000-000000000000" for i in range(3)]
+
+    async def _kill(job_id: str) -> None:
+        if job_id == job_ids[1]:
+            raise ValueError("Job is already finished")
+
+    root.client.jobs.kill = AsyncMock(side_effect=_kill)  # type: ignore
+
+    result = CliRunner().invoke(kill, job_ids, obj=root)
+
+    assert result.exit_code == 1
+    assert root.client.jobs.kill.await_count == 3
+    # killed jobs are printed as the requests complete
+    assert sorted(result.output.splitlines()) == [job_ids[0], job_ids[2]]
+
+
+def test_kill_limits_concurrency(root: Root) -> None:
+    job_ids = [f"job-{i:08d}-0000-0000-0000-000000000000" for i in range(25)]
+    running = 0
+    max_running = 0
+
+    async def _kill(job_id: str) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    root.client.jobs.kill = AsyncMock(side_effect=_kill)  # type: ignore
+
+    result = CliRunner().invoke(kill, job_ids, obj=root)
+
+    assert result.exit_code == 0
+    assert sorted(result.output.splitlines()) == job_ids
+    assert max_running == MAX_CONCURRENT_KILLS
+
+
+def test_kill_cancels_pending_requests_on_error(root: Root) -> None:
+    job_ids = [f"job-{i:08d}-0000-0000-0000-000000000000" for i in range(3)]
+    cancelled = []
+
+    async def _kill(job_id: str) -> None:
+        if job_id == job_ids[0]:
+            raise RuntimeError("Unexpected")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(job_id)
+            raise
+
+    root.client.jobs.kill = AsyncMock(side_effect=_kill)  # type: ignore
+
+    result = CliRunner().invoke(kill, job_ids, obj=root)
+
+    assert isinstance(result.exception, RuntimeError)
+    assert sorted(cancelled) == job_ids[1:]
+
+
+def test_ps_quiet_prints_job_ids(root: Root) -> None:
+    job_ids = [f"job-{i:08d}-0000-0000-0000-000000000000" for i in range(3)]
+
+    async def _jobs() -> AsyncIterator[Any]:
+        for job_id in job_ids:
+            yield SimpleNamespace(id=job_id)
+
+    @contextlib.asynccontextmanager
+    async def _list(**kwargs: Any) -> AsyncIterator[AsyncIterator[Any]]:
+        yield _jobs()
+
+    root.client.jobs.list = _list  # type: ignore
+    root.verbosity = -1
+
+    result = CliRunner().invoke(ls, [], obj=root)
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == job_ids
@@ -0,0 +1,21 @@
+import logging
+
+import pytest
+
+from apolo_cli.log_formatter import ConsoleHandler
+
+
+@pytest.mark.parametrize(
+    "level,prefix",
+    [
+        (logging.DEBUG, ""),
+        (logging.INFO, ""),
+        (logging.WARNING, "[bold yellow]WARNING[/bold yellow]: "),
+        (logging.ERROR, "[bold red]ERROR[/bold red]: "),
+        (logging.CRITICAL, "[bold red]CRITICAL[/bold red]: "),
+    ],
+)
+def test_get_level_message(level: int, prefix: str) -> None:
+    handler = ConsoleHandler(color=False)
+    record = logging.LogRecord("name", level, "path", 1, "message", None, None)
+    assert handler.get_level_message(record) == prefix
@@ -1,5 +1,21 @@
+import asyncio
 from typing import Any
 
+import aiohttp
+import pytest
+
+import apolo_sdk
+
+from apolo_cli.const import (
+    EX_DATAERR,
+    EX_IOERR,
+    EX_NOPERM,
+    EX_OSFILE,
+    EX_SOFTWARE,
+    EX_TIMEOUT,
+)
+from apolo_cli.main import _find_error_handler
+
 
 def test_help(run_cli: Any) -> None:
     capture = run_cli(["help"])
@@ -10,3 +26,21 @@ def test_help(run_cli: Any) -> None:
     assert "[OPTIONS] COMMAND [ARGS]..." in capture.out
     assert "Commands:" in capture.out
     assert "help <command>" in capture.out
+
+
+@pytest.mark.parametrize(
+    "error,code",
+    [
+        (asyncio.TimeoutError(), EX_TIMEOUT),
+        (apolo_sdk.IllegalArgumentError("bad"), EX_DATAERR),
+        (apolo_sdk.AuthenticationError("denied"), EX_NOPERM),
+        (apolo_sdk.AuthError("denied"), EX_SOFTWARE),
+        (aiohttp.ClientOSError(), EX_IOERR),
+        (FileNotFoundError("missing"), EX_OSFILE),
+        (IsADirectoryError("dir"), EX_IOERR),
+        (KeyboardInterrupt(), 130),
+        (ValueError("value"), 127),
+    ],
+)
+def test_find_error_handler(error: BaseException, code: int) -> None:
+    assert _find_error_handler(error)[0] == code
@@ -16,33 +16,40 @@ from apolo_cli.parse_utils import (
     parse_top_columns,
 )
 
+MEMORY_SUFFIXES = [
+    (1, ""),
+    (10**3, "k"),
+    (10**6, "M"),
+    (10**9, "G"),
+    (10**12, "T"),
+    (10**15, "P"),
+    (2**10, "Ki"),
+    (2**20, "Mi"),
+    (2**30, "Gi"),
+    (2**40, "Ti"),
+    (2**50, "Pi"),
+]
+
+
+@pytest.mark.parametrize("factor,suffix", MEMORY_SUFFIXES)
+@pytest.mark.parametrize("byte_suffix", ["B", "b", ""])
+def test_parse_memory(factor: int, suffix: str, byte_suffix: str) -> None:
+    for number in [100, 200, 222, 42, 37]:
+        assert parse_memory(str(number) + suffix + byte_suffix) == number * factor
 
-def test_parse_memory() -> None:
-    for bad_value in ["   ", "", "-124", "some_text_here"]:
-        with pytest.raises(ValueError, match=f"Unable parse value: {bad_value}"):
-            parse_memory(bad_value)
 
-    for number in [100, 200, 222, 42, 37]:
-        for factor, suffix in [
-            (1, ""),
-            (10**3, "k"),
-            (10**6, "M"),
-            (10**9, "G"),
-            (10**12, "T"),
-            (10**15, "P"),
-            (2**10, "Ki"),
-            (2**20, "Mi"),
-            (2**30, "Gi"),
-            (2**40, "Ti"),
-            (2**50, "Pi"),
-        ]:
-            for byte_suffix in ["B", "b", ""]:
-                assert (
-                    parse_memory(str(number) + suffix + byte_suffix) == number * factor
-                )
-            bad_value = suffix + byte_suffix
-            with pytest.raises(ValueError, match=f"Unable parse value: {bad_value}"):
-                parse_memory(bad_value)
+@pytest.mark.parametrize(
+    "bad_value",
+    ["   ", "", "-124", "some_text_here"]
+    + [
+        suffix + byte_suffix
+        for _, suffix in MEMORY_SUFFIXES
+        for byte_suffix in ["B", "b", ""]
+    ],
+)
+def test_parse_memory_invalid(bad_value: str) -> None:
+    with pytest.raises(ValueError, match=f"Unable parse value: {bad_value}"):
+        parse_memory(bad_value)
 
 
 def test_parse_ps_columns_default() -> None:
@@ -88,12 +88,14 @@ def autocomplete(
     args = _default_args(verbosity, network_timeout, nmrc_path)
     env = dict(os.environ)
 
-    env["_PYTEST_COMPLETE"] = f"{shell}_complete"
+    # click derives the completion variable from the program name
+    env["_APOLO_COMPLETE"] = f"{shell}_complete"
     env["COMP_WORDS"] = " ".join(shlex.quote(arg) for arg in [*args, *arguments])
     env["COMP_CWORD"] = str(len(args) + len(arguments) - 1)
     env["NEURO_CLI_JOB_AUTOCOMPLETE_LIMIT"] = "500"
 
     monkeypatch.setattr(os, "environ", env)
+    monkeypatch.setattr(sys, "argv", ["apolo"])
     proc = run_cli([])
     assert proc.code == 0
     assert not proc.err
@@ -1,13 +1,13 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, NoReturn, cast
-from unittest import mock
+from typing import Any, cast
 
 import click
 import pytest
 import toml
 from aiohttp import web
+from aiohttp.test_utils import TestServer
 from yarl import URL
 
 from apolo_sdk import Action, Client, JobStatus, PluginManager
@@ -27,6 +27,7 @@ from apolo_cli.utils import (
 from tests import _TestServerFactory
 
 _MakeClient = Callable[..., Client]
+_StartJobsServer = Callable[..., Awaitable[TestServer]]
 
 
 def _job_entry(
@@ -70,8 +71,10 @@ def _job_entry(
     }
 
 
-def _check_params(request: web.Request, **expected: str | list[str] | set[str]) -> None:
-    # Since `resolve_job` excepts any Exception, `assert` will be caught there
+def _check_params(
+    request: web.Request, **expected: str | list[str] | set[str]
+) -> list[str]:
+    mismatches = []
     for key, value in expected.items():
         got: list[str] | set[str] = request.query.getall(key)
         if isinstance(value, set):
@@ -79,63 +82,72 @@ def _check_params(request: web.Request, **expected: str | list[str] | set[str])
         elif not isinstance(value, list):
             value = [value]
         if got != value:
-            print(f"received: {key}={got!r} (expected {value!r})")
-            pytest.fail(f"received: {key}={got!r} (expected {value!r})")
+            mismatches.append(f"received: {key}={got!r} (expected {value!r})")
+    return mismatches
 
 
-async def test_resolve_job_id__from_string__no_jobs_found(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
-) -> None:
-    JSON: dict[str, Any] = {"jobs": []}
-    job_id = "job-81839be3-3ecf-4ec5-80d9-19b1588869db"
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_id,
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        return web.json_response(JSON)
+@pytest.fixture
+def start_jobs_server(aiohttp_server: _TestServerFactory) -> Iterator[_StartJobsServer]:
+    mismatches: list[str] = []
 
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
+    async def go(
+        jobs: list[dict[str, Any]] | None, **expected: str | list[str]
+    ) -> TestServer:
+        # jobs=None makes the handler fail with a server error
+        async def handler(request: web.Request) -> web.Response:
+            mismatches.extend(_check_params(request, reverse="1", **expected))
+            if jobs is None:
+                raise web.HTTPError()
+            return web.json_response({"jobs": jobs})
 
-    srv = await aiohttp_server(app)
+        app = web.Application()
+        app.router.add_get("/jobs", handler)
+        return await aiohttp_server(app)
 
-    async with make_client(srv.make_url("/")) as client:
-        resolved = await resolve_job(job_id, client=client, status={JobStatus.RUNNING})
-        assert resolved == job_id
-        resolved_ex = await resolve_job_ex(
-            job_id, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved_ex == (job_id, "default")
+    yield go
+    # `resolve_job` excepts any Exception, so failing inside the handler
+    # would go unnoticed; check the recorded requests afterwards instead
+    assert not mismatches
 
 
-@pytest.mark.parametrize("cluster_name", ["default", "other"])
-async def test_resolve_job_id__from_uri_with_same_project__no_jobs_found(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient, cluster_name: str
+@pytest.mark.parametrize("jobs", [[], None], ids=["no_jobs_found", "server_error"])
+@pytest.mark.parametrize(
+    "uri,job_name,cluster_name",
+    [
+        pytest.param(
+            "job-81839be3-3ecf-4ec5-80d9-19b1588869db",
+            "job-81839be3-3ecf-4ec5-80d9-19b1588869db",
+            "default",
+            id="from_string",
+        ),
+        pytest.param(
+            "job://default/test-project/my-job-name",
+            "my-job-name",
+            "default",
+            id="from_uri_with_same_project-default",
+        ),
+        pytest.param(
+            "job://other/test-project/my-job-name",
+            "my-job-name",
+            "other",
+            id="from_uri_with_same_project-other",
+        ),
+        pytest.param(
+            "job:my-job-name", "my-job-name", "default", id="from_uri_without_project"
+        ),
+    ],
+)
+async def test_resolve_job_id__not_found(
+    start_jobs_server: _StartJobsServer,
+    make_client: _MakeClient,
+    uri: str,
+    job_name: str,
+    cluster_name: str,
+    jobs: list[dict[str, Any]] | None,
 ) -> None:
-    job_project = "test-project"
-    job_name = "my-job-name"
-    uri = f"job://{cluster_name}/{job_project}/{job_name}"
-    JSON: dict[str, Any] = {"jobs": []}
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name=cluster_name,
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+    srv = await start_jobs_server(
+        jobs, name=job_name, project_name="test-project", cluster_name=cluster_name
+    )
 
     async with make_client(srv.make_url("/")) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -145,31 +157,19 @@ async def test_resolve_job_id__from_uri_with_same_project__no_jobs_found(
         )
         assert resolved_ex == (job_name, cluster_name)
 
-    await srv.close()
 
-
-async def test_resolve_job_id__from_uri_with_other_project__no_jobs_found(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
+@pytest.mark.parametrize("jobs", [[], None], ids=["no_jobs_found", "server_error"])
+async def test_resolve_job_id__from_uri_with_other_project__not_found(
+    start_jobs_server: _StartJobsServer,
+    make_client: _MakeClient,
+    jobs: list[dict[str, Any]] | None,
 ) -> None:
     job_project = "other-test-project"
     job_name = "my-job-name"
     uri = f"job://default/{job_project}/{job_name}"
-    JSON: dict[str, Any] = {"jobs": []}
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name="default",
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+    srv = await start_jobs_server(
+        jobs, name=job_name, project_name=job_project, cluster_name="default"
+    )
 
     async with make_client(srv.make_url("/")) as client:
         with pytest.raises(ValueError):
@@ -177,64 +177,19 @@ async def test_resolve_job_id__from_uri_with_other_project__no_jobs_found(
         with pytest.raises(ValueError):
             await resolve_job_ex(uri, client=client, status={JobStatus.RUNNING})
 
-    await srv.close()
-
-
-async def test_resolve_job_id__from_uri_without_project__no_jobs_found(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
-) -> None:
-    job_name = "my-job-name"
-    uri = f"job:{job_name}"
-    JSON: dict[str, Any] = {"jobs": []}
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
-
-    async with make_client(srv.make_url("/")) as client:
-        resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
-        assert resolved == job_name
-        resolved_ex = await resolve_job_ex(
-            uri, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved_ex == (job_name, "default")
-
-    await srv.close()
-
 
 async def test_resolve_job_id__from_string__single_job_found(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
+    start_jobs_server: _StartJobsServer, make_client: _MakeClient
 ) -> None:
     job_name = "test-job-name-555"
     job_id = "job-id-1"
-    JSON = {"jobs": [_job_entry(job_id, project_name="test-project", org_name="org")]}
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            org_name="org",
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+    srv = await start_jobs_server(
+        [_job_entry(job_id, project_name="test-project", org_name="org")],
+        name=job_name,
+        org_name="org",
+        project_name="test-project",
+        cluster_name="default",
+    )
 
     async with make_client(srv.make_url("/")) as client:
         resolved = await resolve_job(
@@ -246,13 +201,11 @@ async def test_resolve_job_id__from_string__single_job_found(
         )
         assert resolved_ex == (job_id, "default")
 
-    await srv.close()
-
 
 @pytest.mark.parametrize("cluster_name", ["default", "other"])
 @pytest.mark.parametrize("org_name", ["org", "test-org"])
 async def test_resolve_job_id__from_uri_with_same_project__single_job_found(
-    aiohttp_server: _TestServerFactory,
+    start_jobs_server: _StartJobsServer,
     make_client: _MakeClient,
     cluster_name: str,
     org_name: str,
@@ -261,32 +214,20 @@ async def test_resolve_job_id__from_uri_with_same_project__single_job_found(
     job_name = "my-job-name"
     uri = f"job://{cluster_name}/{job_project}/{job_name}"
     job_id = "job-id-1"
-    JSON = {
-        "jobs": [
+    srv = await start_jobs_server(
+        [
             _job_entry(
                 job_id,
                 cluster_name=cluster_name,
                 project_name=job_project,
                 org_name=org_name,
             )
-        ]
-    }
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name=cluster_name,
-            reverse="1",
-            org_name=org_name,
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+        ],
+        name=job_name,
+        project_name=job_project,
+        cluster_name=cluster_name,
+        org_name=org_name,
+    )
 
     async with make_client(srv.make_url("/"), org_name=org_name) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -296,13 +237,11 @@ async def test_resolve_job_id__from_uri_with_same_project__single_job_found(
         )
         assert resolved_ex == (job_id, cluster_name)
 
-    await srv.close()
-
 
 @pytest.mark.parametrize("cluster_name", ["default", "other"])
 @pytest.mark.parametrize("org_name", [None, "test-org", "job-org"])
 async def test_resolve_job_id__from_uri_with_org__single_job_found(
-    aiohttp_server: _TestServerFactory,
+    start_jobs_server: _StartJobsServer,
     make_client: _MakeClient,
     cluster_name: str,
     org_name: str | None,
@@ -312,36 +251,23 @@ async def test_resolve_job_id__from_uri_with_org__single_job_found(
     job_name = "my-job-name"
     uri = f"job://{cluster_name}/{job_org}/{job_project}/{job_name}"
     job_id = "job-id-1"
-    JSON = {
-        "jobs": [
+    srv = await start_jobs_server(
+        [
             _job_entry(
                 job_id,
                 cluster_name=cluster_name,
                 org_name=job_org,
                 project_name=job_project,
             )
-        ]
-    }
-
-    async def handler(request: web.Request) -> web.Response:
-        expected_projects = (
+        ],
+        name=job_name,
+        project_name=(
             [f"{job_org}/{job_project}", job_project]
             if org_name != job_org
             else [job_project]
-        )
-        _check_params(
-            request,
-            name=job_name,
-            project_name=expected_projects,
-            cluster_name=cluster_name,
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+        ),
+        cluster_name=cluster_name,
+    )
 
     async with make_client(srv.make_url("/"), org_name=org_name) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -351,13 +277,11 @@ async def test_resolve_job_id__from_uri_with_org__single_job_found(
         )
         assert resolved_ex == (job_id, cluster_name)
 
-    await srv.close()
-
 
 @pytest.mark.parametrize("cluster_name", ["default", "other"])
 @pytest.mark.parametrize("org_name", ["org", "test-org"])
 async def test_resolve_job_id__from_uri__multiple_jobs_found(
-    aiohttp_server: _TestServerFactory,
+    start_jobs_server: _StartJobsServer,
     make_client: _MakeClient,
     cluster_name: str,
     org_name: str,
@@ -367,8 +291,8 @@ async def test_resolve_job_id__from_uri__multiple_jobs_found(
     job_name = "my-job-name"
     uri = f"job://{cluster_name}/{job_project}/{job_name}"
     job_ids = [f"job-id-{i}" for i in range(4)]
-    JSON = {
-        "jobs": [
+    srv = await start_jobs_server(
+        [
             _job_entry(
                 job_ids[0],
                 cluster_name=cluster_name,
@@ -393,24 +317,12 @@ async def test_resolve_job_id__from_uri__multiple_jobs_found(
                 org_name="other-org",
                 project_name=job_project,
             ),
-        ]
-    }
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name=cluster_name,
-            reverse="1",
-            org_name=org_name,
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+        ],
+        name=job_name,
+        project_name=job_project,
+        cluster_name=cluster_name,
+        org_name=org_name,
+    )
 
     async with make_client(srv.make_url("/"), org_name=org_name) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -420,13 +332,11 @@ async def test_resolve_job_id__from_uri__multiple_jobs_found(
         )
         assert resolved_ex == (job_ids[2], cluster_name)
 
-    await srv.close()
-
 
 @pytest.mark.parametrize("cluster_name", ["default", "other"])
 @pytest.mark.parametrize("org_name", ["org", "test-org"])
 async def test_resolve_job_id__from_uri_with_org__multiple_jobs_found(
-    aiohttp_server: _TestServerFactory,
+    start_jobs_server: _StartJobsServer,
     make_client: _MakeClient,
     cluster_name: str,
     org_name: str,
@@ -436,8 +346,8 @@ async def test_resolve_job_id__from_uri_with_org__multiple_jobs_found(
     job_name = "my-job-name"
     uri = f"job://{cluster_name}/{job_org}/{job_project}/{job_name}"
     job_ids = [f"job-id-{i}" for i in range(4)]
-    JSON = {
-        "jobs": [
+    srv = await start_jobs_server(
+        [
             _job_entry(
                 job_ids[0],
                 cluster_name=cluster_name,
@@ -457,24 +367,12 @@ async def test_resolve_job_id__from_uri_with_org__multiple_jobs_found(
                 project_name=job_project,
                 org_name="other-org",
             ),
-        ]
-    }
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=[f"{job_org}/{job_project}", job_project],
-            cluster_name=cluster_name,
-            reverse="1",
-            org_name=org_name,
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+        ],
+        name=job_name,
+        project_name=[f"{job_org}/{job_project}", job_project],
+        cluster_name=cluster_name,
+        org_name=org_name,
+    )
 
     async with make_client(srv.make_url("/"), org_name=org_name) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -484,36 +382,22 @@ async def test_resolve_job_id__from_uri_with_org__multiple_jobs_found(
         )
         assert resolved_ex == (job_ids[2], cluster_name)
 
-    await srv.close()
-
 
 @pytest.mark.parametrize("org_name", ["org", "test-org"])
 async def test_resolve_job_id__from_uri_without_project__single_job_found(
-    aiohttp_server: _TestServerFactory,
+    start_jobs_server: _StartJobsServer,
     make_client: _MakeClient,
     org_name: str,
 ) -> None:
     job_name = "my-job-name"
     uri = f"job:{job_name}"
     job_id = "job-id-1"
-    JSON = {
-        "jobs": [_job_entry(job_id, project_name="test-project", org_name=org_name)]
-    }
-
-    async def handler(request: web.Request) -> web.Response:
-        _check_params(
-            request,
-            name=job_name,
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        return web.json_response(JSON)
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
+    srv = await start_jobs_server(
+        [_job_entry(job_id, project_name="test-project", org_name=org_name)],
+        name=job_name,
+        project_name="test-project",
+        cluster_name="default",
+    )
 
     async with make_client(srv.make_url("/"), org_name=org_name) as client:
         resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
@@ -523,139 +407,6 @@ async def test_resolve_job_id__from_uri_without_project__single_job_found(
         )
         assert resolved_ex == (job_id, "default")
 
-    await srv.close()
-
-
-async def test_resolve_job_id__server_error(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
-) -> None:
-    job_id = "job-81839be3-3ecf-4ec5-80d9-19b1588869db"
-    job_name = job_id
-
-    async def handler(request: web.Request) -> NoReturn:
-        _check_params(
-            request,
-            name=job_name,
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        raise web.HTTPError()
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
-
-    async with make_client(srv.make_url("/")) as client:
-        resolved = await resolve_job(
-            job_name, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved == job_id
-        resolved_ex = await resolve_job_ex(
-            job_name, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved_ex == (job_id, "default")
-
-    await srv.close()
-
-
-@pytest.mark.parametrize("cluster_name", ["default", "other"])
-async def test_resolve_job_id__from_uri_with_same_project__server_error(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient, cluster_name: str
-) -> None:
-    job_project = "test-project"
-    job_name = "my-job-name"
-    uri = f"job://{cluster_name}/{job_project}/{job_name}"
-
-    async def handler(request: web.Request) -> NoReturn:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name=cluster_name,
-            reverse="1",
-        )
-        raise web.HTTPError()
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
-
-    async with make_client(srv.make_url("/")) as client:
-        resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
-        assert resolved == job_name
-        resolved_ex = await resolve_job_ex(
-            uri, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved_ex == (job_name, cluster_name)
-
-    await srv.close()
-
-
-async def test_resolve_job_id__from_uri_with_other_project__server_error(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
-) -> None:
-    job_project = "other-test-project"
-    job_name = "my-job-name"
-    uri = f"job://default/{job_project}/{job_name}"
-
-    async def handler(request: web.Request) -> NoReturn:
-        _check_params(
-            request,
-            name=job_name,
-            project_name=job_project,
-            cluster_name="default",
-            reverse="1",
-        )
-        raise web.HTTPError()
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
-
-    async with make_client(srv.make_url("/")) as client:
-        with pytest.raises(ValueError):
-            await resolve_job(uri, client=client, status={JobStatus.RUNNING})
-        with pytest.raises(ValueError):
-            await resolve_job_ex(uri, client=client, status={JobStatus.RUNNING})
-
-    await srv.close()
-
-
-async def test_resolve_job_id__from_uri_without_project__server_error(
-    aiohttp_server: _TestServerFactory, make_client: _MakeClient
-) -> None:
-    job_name = "my-job-name"
-    uri = f"job:{job_name}"
-
-    async def handler(request: web.Request) -> NoReturn:
-        _check_params(
-            request,
-            name=job_name,
-            project_name="test-project",
-            cluster_name="default",
-            reverse="1",
-        )
-        raise web.HTTPError()
-
-    app = web.Application()
-    app.router.add_get("/jobs", handler)
-
-    srv = await aiohttp_server(app)
-
-    async with make_client(srv.make_url("/")) as client:
-        resolved = await resolve_job(uri, client=client, status={JobStatus.RUNNING})
-        assert resolved == job_name
-        resolved_ex = await resolve_job_ex(
-            uri, client=client, status={JobStatus.RUNNING}
-        )
-        assert resolved_ex == (job_name, "default")
-
-    await srv.close()
-
 
 @pytest.mark.parametrize(
     "uri",
@@ -703,16 +454,29 @@ def test_parse_file_resource_unsupported_scheme(root: Root) -> None:
         parse_file_resource("image:ubuntu", root)
 
 
-def test_parse_file_resource_project_less(root: Root) -> None:
-    user_less_permission = parse_file_resource("storage:resource", root)
+_RESOURCE_PARSERS = pytest.mark.parametrize(
+    "parser",
+    [parse_file_resource, parse_resource_for_sharing],
+    ids=["file_resource", "resource_for_sharing"],
+)
+
+
+@_RESOURCE_PARSERS
+def test_parse_resource_project_less(
+    root: Root, parser: Callable[[str, Root], URL]
+) -> None:
+    user_less_permission = parser("storage:resource", root)
     assert user_less_permission == URL(
         f"storage://{root.client.cluster_name}"
         f"/org/{root.client.config.project_name}/resource"
     )
 
 
-def test_parse_file_resource_with_project(root: Root) -> None:
-    full_permission = parse_file_resource(
+@_RESOURCE_PARSERS
+def test_parse_resource_with_project(
+    root: Root, parser: Callable[[str, Root], URL]
+) -> None:
+    full_permission = parser(
         f"storage://{root.client.cluster_name}"
         f"/{root.client.config.project_name}/resource",
         root,
@@ -721,13 +485,16 @@ def test_parse_file_resource_with_project(root: Root) -> None:
         f"storage://{root.client.cluster_name}"
         f"/{root.client.config.project_name}/resource"
     )
-    full_permission = parse_file_resource(f"storage://default/alice/resource", root)
+    full_permission = parser(f"storage://default/alice/resource", root)
     assert full_permission == URL(f"storage://default/alice/resource")
 
 
-def test_parse_file_resource_with_tilde(root: Root) -> None:
+@_RESOURCE_PARSERS
+def test_parse_resource_with_tilde(
+    root: Root, parser: Callable[[str, Root], URL]
+) -> None:
     with pytest.raises(ValueError, match=r"Cannot expand user for "):
-        parse_file_resource(f"storage://~/resource", root)
+        parser(f"storage://~/resource", root)
 
 
 def test_parse_resource_for_sharing_image_no_tag(root: Root) -> None:
@@ -791,68 +558,24 @@ def test_parse_resource_for_sharing_unsupported_scheme(root: Root) -> None:
         parse_resource_for_sharing(r"c:scheme-less/resource", root)
 
 
-def test_parse_resource_for_sharing_user_less(root: Root) -> None:
-    user_less_permission = parse_resource_for_sharing("storage:resource", root)
-    assert user_less_permission == URL(
-        f"storage://{root.client.cluster_name}"
-        f"/org/{root.client.config.project_name}/resource"
-    )
-
-
-def test_parse_resource_for_sharing_with_project(root: Root) -> None:
-    full_permission = parse_resource_for_sharing(
-        f"storage://{root.client.cluster_name}"
-        f"/{root.client.config.project_name}/resource",
-        root,
-    )
-    assert full_permission == URL(
-        f"storage://{root.client.cluster_name}"
-        f"/{root.client.config.project_name}/resource"
-    )
-    full_permission = parse_resource_for_sharing(
-        f"storage://default/alice/resource", root
-    )
-    assert full_permission == URL(f"storage://default/alice/resource")
-
-
-def test_parse_resource_for_sharing_with_tilde(root: Root) -> None:
-    with pytest.raises(ValueError, match=r"Cannot expand user for "):
-        parse_resource_for_sharing(f"storage://~/resource", root)
-
-
 def test_parse_resource_for_sharing_with_tilde_relative(root: Root) -> None:
     with pytest.raises(ValueError, match=r"Cannot expand user for "):
         parse_resource_for_sharing(f"storage:~/resource", root)
 
 
-def test_parse_permission_action_read_lowercase() -> None:
-    action = "read"
-    assert parse_permission_action(action) == Action.READ
-
-
-def test_parse_permission_action_read() -> None:
-    action = "READ"
-    assert parse_permission_action(action) == Action.READ
-
-
-def test_parse_permission_action_write_lowercase() -> None:
-    action = "write"
-    assert parse_permission_action(action) == Action.WRITE
-
-
-def test_parse_permission_action_write() -> None:
-    action = "WRITE"
-    assert parse_permission_action(action) == Action.WRITE
-
-
-def test_parse_permission_action_manage_lowercase() -> None:
-    action = "manage"
-    assert parse_permission_action(action) == Action.MANAGE
-
-
-def test_parse_permission_action_manage() -> None:
-    action = "MANAGE"
-    assert parse_permission_action(action) == Action.MANAGE
+@pytest.mark.parametrize(
+    "action,expected",
+    [
+        ("read", Action.READ),
+        ("READ", Action.READ),
+        ("write", Action.WRITE),
+        ("WRITE", Action.WRITE),
+        ("manage", Action.MANAGE),
+        ("MANAGE", Action.MANAGE),
+    ],
+)
+def test_parse_permission_action(action: str, expected: Action) -> None:
+    assert parse_permission_action(action) == expected
 
 
 def test_parse_permission_action_wrong_string() -> None:
@@ -869,65 +592,73 @@ def test_parse_permission_action_wrong_empty() -> None:
         parse_permission_action(action)
 
 
-def test_pager_maybe_no_tty() -> None:
-    with mock.patch.multiple(
-        "click", echo=mock.DEFAULT, echo_via_pager=mock.DEFAULT
-    ) as mocked:
-        mock_echo = mocked["echo"]
-        mock_echo_via_pager = mocked["echo_via_pager"]
-
-        terminal_size = (100, 10)
-        tty = False
-        large_input = [f"line {x}" for x in range(20)]
-
-        pager_maybe(large_input, tty, terminal_size)
-        assert mock_echo.call_args_list == [mock.call(x) for x in large_input]
-        mock_echo_via_pager.assert_not_called()
-
-
-def test_pager_maybe_terminal_larger() -> None:
-    with mock.patch.multiple(
-        "click", echo=mock.DEFAULT, echo_via_pager=mock.DEFAULT
-    ) as mocked:
-        mock_echo = mocked["echo"]
-        mock_echo_via_pager = mocked["echo_via_pager"]
-
-        terminal_size = (100, 10)
-        tty = True
-        small_input = ["line 1", "line 2"]
-
-        pager_maybe(small_input, tty, terminal_size)
-        assert mock_echo.call_args_list == [mock.call(x) for x in small_input]
-        mock_echo_via_pager.assert_not_called()
-
-
-def test_pager_maybe_terminal_smaller() -> None:
-    with mock.patch.multiple(
-        "click", echo=mock.DEFAULT, echo_via_pager=mock.DEFAULT
-    ) as mocked:
-        mock_echo = mocked["echo"]
-        mock_echo_via_pager = mocked["echo_via_pager"]
-
-        terminal_size = (100, 10)
-        tty = True
-        large_input = [f"line {x}" for x in range(20)]
-
-        pager_maybe(large_input, tty, terminal_size)
-        mock_echo.assert_not_called()
-        mock_echo_via_pager.assert_called_once()
-        lines_it = mock_echo_via_pager.call_args[0][0]
-        assert "".join(lines_it) == "\n".join(large_input)
-
-        # Do the same, but call with a generator function for input instead
-        mock_echo_via_pager.reset_mock()
-        iter_input = iter(large_input)
-        next(iter_input)  # Skip first line
-
-        pager_maybe(iter_input, tty, terminal_size)
-        mock_echo.assert_not_called()
-        mock_echo_via_pager.assert_called_once()
-        lines_it = mock_echo_via_pager.call_args[0][0]
-        assert "".join(lines_it) == "\n".join(large_input[1:])
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[Any, ...]] = []
+
+    def __call__(self, *args: Any) -> None:
+        self.calls.append(args)
+
+
+@pytest.fixture
+def echo(monkeypatch: Any) -> _Recorder:
+    recorder = _Recorder()
+    monkeypatch.setattr(click, "echo", recorder)
+    return recorder
+
+
+@pytest.fixture
+def echo_via_pager(monkeypatch: Any) -> _Recorder:
+    recorder = _Recorder()
+    monkeypatch.setattr(click, "echo_via_pager", recorder)
+    return recorder
+
+
+def test_pager_maybe_no_tty(echo: _Recorder, echo_via_pager: _Recorder) -> None:
+    terminal_size = (100, 10)
+    tty = False
+    large_input = [f"line {x}" for x in range(20)]
+
+    pager_maybe(large_input, tty, terminal_size)
+    assert echo.calls == [(x,) for x in large_input]
+    assert echo_via_pager.calls == []
+
+
+def test_pager_maybe_terminal_larger(
+    echo: _Recorder, echo_via_pager: _Recorder
+) -> None:
+    terminal_size = (100, 10)
+    tty = True
+    small_input = ["line 1", "line 2"]
+
+    pager_maybe(small_input, tty, terminal_size)
+    assert echo.calls == [(x,) for x in small_input]
+    assert echo_via_pager.calls == []
+
+
+def test_pager_maybe_terminal_smaller(
+    echo: _Recorder, echo_via_pager: _Recorder
+) -> None:
+    terminal_size = (100, 10)
+    tty = True
+    large_input = [f"line {x}" for x in range(20)]
+
+    pager_maybe(large_input, tty, terminal_size)
+    assert echo.calls == []
+    assert len(echo_via_pager.calls) == 1
+    lines_it = echo_via_pager.calls[0][0]
+    assert "".join(lines_it) == "\n".join(large_input)
+
+    # Do the same, but call with a generator function for input instead
+    echo_via_pager.calls.clear()
+    iter_input = iter(large_input)
+    next(iter_input)  # Skip first line
+
+    pager_maybe(iter_input, tty, terminal_size)
+    assert echo.calls == []
+    assert len(echo_via_pager.calls) == 1
+    lines_it = echo_via_pager.calls[0][0]
+    assert "".join(lines_it) == "\n".join(large_input[1:])
 
 
 async def test_calc_life_span_none_default(
@@ -77,12 +77,16 @@ class Client(metaclass=NoPublicConstructor):
         if self._closed:
             return
         self._closed = True
-        with self._config._open_db() as db:
-            self._core._save_cookies(db)
-        await self._core.close()
-        if self._images is not None:
-            await self._images._close()
-        await self._session.close()
+        try:
+            with self._config._open_db() as db:
+                self._core._save_cookies(db)
+            await self._core.close()
+            if self._images is not None:
+                await self._images._close()
+        finally:
+            # The session owns the connection pool shared by all sub-APIs,
+            # release it even if the cleanup above has failed.
+            await self._session.close()
 
     async def __aenter__(self) -> "Client":
         return self
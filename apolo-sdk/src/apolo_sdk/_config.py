@@ -91,6 +91,12 @@ class _ConfigRecoveryData:
     refresh_token: str
 
 
+# (filename, allow_cluster_name, allow_org_name) -> ((mtime_ns, size), config)
+_UserConfigCache = dict[
+    tuple[Path, bool, bool], tuple[tuple[int, int], Mapping[str, Any]]
+]
+
+
 @rewrite_module
 class Config(metaclass=NoPublicConstructor):
     def __init__(self, core: _Core, path: Path, plugin_manager: PluginManager) -> None:
@@ -98,6 +104,7 @@ class Config(metaclass=NoPublicConstructor):
         self._path = path
         self._plugin_manager = plugin_manager
         self.__config_data: _ConfigData | None = None
+        self._user_config_cache: _UserConfigCache = {}
 
     def _load(self) -> _ConfigData:
         ret = self.__config_data = _load(self._path)
@@ -453,10 +460,12 @@ class Config(metaclass=NoPublicConstructor):
         ).decode("ascii")
 
     async def get_user_config(self) -> Mapping[str, Any]:
-        return _load_user_config(self._plugin_manager, self._path)
+        return self._get_user_config()
 
     def _get_user_config(self) -> Mapping[str, Any]:
-        return _load_user_config(self._plugin_manager, self._path)
+        return _load_user_config(
+            self._plugin_manager, self._path, self._user_config_cache
+        )
 
     @contextlib.contextmanager
     def _open_db(self, suppress_errors: bool = True) -> Iterator[sqlite3.Connection]:
@@ -464,7 +473,11 @@ class Config(metaclass=NoPublicConstructor):
             yield db
 
 
-def _load_user_config(plugin_manager: PluginManager, path: Path) -> Mapping[str, Any]:
+def _load_user_config(
+    plugin_manager: PluginManager,
+    path: Path,
+    cache: _UserConfigCache | None = None,
+) -> Mapping[str, Any]:
     # TODO: search in several locations (HOME+curdir),
     # merge found configs
     filename = path / "user.toml"
@@ -475,7 +488,11 @@ def _load_user_config(plugin_manager: PluginManager, path: Path) -> Mapping[str,
         raise ConfigError(f"User config {filename} should be a regular file")
     else:
         config = _load_file(
-            plugin_manager, filename, allow_cluster_name=False, allow_org_name=False
+            plugin_manager,
+            filename,
+            allow_cluster_name=False,
+            allow_org_name=False,
+            cache=cache,
         )
     try:
         project_root = find_project_root()
@@ -488,7 +505,11 @@ def _load_user_config(plugin_manager: PluginManager, path: Path) -> Mapping[str,
             if filename2.exists():
                 filename = filename2
         local_config = _load_file(
-            plugin_manager, filename, allow_cluster_name=True, allow_org_name=True
+            plugin_manager,
+            filename,
+            allow_cluster_name=True,
+            allow_org_name=True,
+            cache=cache,
         )
         return _merge_user_configs(config, local_config)
 
@@ -1264,7 +1285,17 @@ def _load_file(
     *,
     allow_cluster_name: bool,
     allow_org_name: bool,
+    cache: _UserConfigCache | None = None,
 ) -> Mapping[str, Any]:
+    # Config properties like cluster_name are read many times per command,
+    # reuse the parsed and validated file until it is changed on disk.
+    if cache is not None:
+        stat = filename.stat()
+        cache_key = (filename, allow_cluster_name, allow_org_name)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
     try:
         config = toml.load(filename)
     except ValueError as exc:
@@ -1276,6 +1307,8 @@ def _load_file(
         allow_cluster_name=allow_cluster_name,
         allow_org_name=allow_org_name,
     )
+    if cache is not None:
+        cache[cache_key] = (stamp, config)
     return config
 
 
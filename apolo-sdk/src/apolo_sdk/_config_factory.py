@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import functools
 import json
 import os
 import ssl
@@ -42,6 +43,16 @@ OLD_CONFIG_ENV_NAME = "NEUROMATION_CONFIG"
 PASS_CONFIG_ENV_NAME = "APOLO_PASSED_CONFIG"
 OLD_PASS_CONFIG_ENV_NAME = "NEURO_PASSED_CONFIG"
 DEFAULT_API_URL = URL("https://api.apolo.us/api/v1")
+# The client talks to a handful of platform hosts only, resolve them once
+# per command instead of every 10 seconds (aiohttp's default).
+DNS_CACHE_TTL = 300
+
+
+@functools.lru_cache(maxsize=1)
+def _make_ssl_context() -> ssl.SSLContext:
+    # Loading certifi's CA bundle is not free; one context is safe to share
+    # between all sessions created by the process.
+    return ssl.create_default_context(cadata=certifi.contents())
 
 
 def _make_session(
@@ -57,8 +68,9 @@ async def __make_session(
 ) -> aiohttp.ClientSession:
     from . import __version__
 
-    ssl_context = ssl.create_default_context(cadata=certifi.contents())
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+    connector = aiohttp.TCPConnector(
+        ssl=_make_ssl_context(), ttl_dns_cache=DNS_CACHE_TTL
+    )
     return aiohttp.ClientSession(
         timeout=timeout,
         connector=connector,
@@ -7,7 +7,7 @@ import time
 from collections.abc import AsyncIterator, Mapping, Sequence
 from contextlib import asynccontextmanager
 from http.cookies import Morsel, SimpleCookie
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 
 import aiohttp
@@ -47,6 +47,18 @@ DROP = {
 
 DEFAULT_TIMEOUT = aiohttp.ClientTimeout(None, None, 60, 60)
 
+_EXCEPTION_MAP = MappingProxyType(
+    {
+        400: IllegalArgumentError,
+        401: AuthenticationError,
+        403: AuthorizationError,
+        404: ResourceNotFound,
+        405: ClientError,
+        502: BadGateway,
+        503: ServerNotAvailable,
+    }
+)
+
 
 class _Core:
     """Transport provider for public API client.
@@ -63,15 +75,6 @@ class _Core:
         self._session = session
         self._trace_id = trace_id
         self._trace_sampled = trace_sampled
-        self._exception_map = {
-            400: IllegalArgumentError,
-            401: AuthenticationError,
-            403: AuthorizationError,
-            404: ResourceNotFound,
-            405: ClientError,
-            502: BadGateway,
-            503: ServerNotAvailable,
-        }
         self._prev_cookie: Morsel[str] | None = None
 
     def _post_init(
@@ -115,7 +118,7 @@ class _Core:
             os_errno: Any = payload["errno"]
             os_errno = errno.__dict__.get(os_errno, os_errno)
             raise OSError(os_errno, err_text)
-        err_cls = self._exception_map.get(status_code, IllegalArgumentError)
+        err_cls = _EXCEPTION_MAP.get(status_code, IllegalArgumentError)
         if err_cls is IllegalArgumentError and payload:
             raise err_cls(err_text, payload=payload)
         raise err_cls(err_text)
@@ -463,7 +463,7 @@ class FileTransferer(Generic[S_PATH, D_PATH]):
             for child in src_files:
                 name = self.src_fs.name(child)
                 if name in ignore_file_names and await self.src_fs.is_file(child):
-                    logger.debug(f"Load ignore file {rel_path}{name}")
+                    logger.debug("Load ignore file %s%s", rel_path, name)
                     file_filter = FileFilter(filter)
                     data = await self.src_fs.read(child)
                     file_filter.read_from_buffer(data, prefix=rel_path)
@@ -475,7 +475,7 @@ class FileTransferer(Generic[S_PATH, D_PATH]):
             if await self.src_fs.is_dir(child):
                 child_rel_path += "/"
             if not await filter(child_rel_path):
-                logger.debug(f"Skip {child_rel_path}")
+                logger.debug("Skip %s", child_rel_path)
                 continue
             if await self.src_fs.is_file(child):
                 offset: int | None = 0
@@ -536,7 +536,7 @@ async def load_parent_ignore_files(
     for name in ignore_file_names:
         config_path = fs.child(path, name)
         if await fs.exists(config_path):
-            logger.debug(f"Load ignore file {str(config_path)!r}")
+            logger.debug("Load ignore file %r", str(config_path))
             file_filter = FileFilter(filter)
             data = await fs.read(config_path)
             file_filter.read_from_buffer(data, "", rel_path)
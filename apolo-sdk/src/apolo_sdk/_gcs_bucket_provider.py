@@ -154,7 +154,9 @@ class GCSProvider(MeasureTimeDiffMixin, BucketProvider):
             if resp.status > 400:
                 # Some error response are OK (404 for example), so just log here
                 response_text = await resp.text()
-                logger.info(f"Request to GCS failed {method} {url}: {response_text}")
+                logger.info(
+                    "Request to GCS failed %s %s: %s", method, url, response_text
+                )
             resp.raise_for_status()
             yield resp
 
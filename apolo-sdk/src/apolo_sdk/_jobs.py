@@ -51,9 +51,12 @@ log = logging.getLogger(__package__)
 
 INVALID_IMAGE_NAME = "INVALID-IMAGE-NAME"
 
+# URL is immutable, most jobs don't expose HTTP so share a single empty instance
+_EMPTY_URL = URL()
+
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Resources:
     memory: int
     cpu: float
@@ -125,14 +128,14 @@ class JobStatus(str, enum.Enum):
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HTTPPort:
     port: int
     requires_auth: bool = True
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Container:
     image: RemoteImage
     resources: Resources
@@ -149,7 +152,7 @@ class Container:
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobStatusItem:
     status: JobStatus
     transition_time: datetime
@@ -159,7 +162,7 @@ class JobStatusItem:
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobStatusHistory:
     status: JobStatus
     reason: str
@@ -209,7 +212,7 @@ class JobPriority(enum.IntEnum):
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobDescriptionInternal:
     materialized: bool = False
     being_dropped: bool = False
@@ -217,7 +220,7 @@ class JobDescriptionInternal:
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobDescription:
     id: str
     owner: str
@@ -236,7 +239,7 @@ class JobDescription:
     name: str | None = None
     tags: Sequence[str] = ()
     description: str | None = None
-    http_url: URL = URL()
+    http_url: URL = _EMPTY_URL
     internal_hostname: str | None = None
     internal_hostname_named: str | None = None
     restart_policy: JobRestartPolicy = JobRestartPolicy.NEVER
@@ -251,7 +254,7 @@ class JobDescription:
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobTelemetry:
     cpu: float
     memory_bytes: int
@@ -271,7 +274,7 @@ class JobTelemetry:
 
 
 @rewrite_module
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     fileno: int
     data: bytes
@@ -1031,23 +1034,25 @@ def _job_description_from_api(res: dict[str, Any], parse: Parser) -> JobDescript
     name = res.get("name")
     tags = res.get("tags", ())
     description = res.get("description")
+    history_raw = res["history"]
     history = JobStatusHistory(
         # Forward-compatible support for CANCELLED status
-        status=_calc_status(res["history"].get("status", "unknown")),
-        reason=res["history"].get("reason", ""),
-        restarts=res["history"].get("restarts", 0),
-        description=res["history"].get("description", ""),
-        created_at=_parse_datetime(res["history"].get("created_at")),
-        started_at=_parse_datetime(res["history"].get("started_at")),
-        finished_at=_parse_datetime(res["history"].get("finished_at")),
-        run_time_seconds=res["history"].get("run_time_seconds"),
-        exit_code=res["history"].get("exit_code"),
+        status=_calc_status(history_raw.get("status", "unknown")),
+        reason=history_raw.get("reason", ""),
+        restarts=history_raw.get("restarts", 0),
+        description=history_raw.get("description", ""),
+        created_at=_parse_datetime(history_raw.get("created_at")),
+        started_at=_parse_datetime(history_raw.get("started_at")),
+        finished_at=_parse_datetime(history_raw.get("finished_at")),
+        run_time_seconds=history_raw.get("run_time_seconds"),
+        exit_code=history_raw.get("exit_code"),
         transitions=[
             _job_status_item_from_api(item_raw) for item_raw in res.get("statuses", [])
         ],
     )
-    http_url = URL(res.get("http_url", ""))
-    http_url_named = URL(res.get("http_url_named", ""))
+    # Prefer the named URL, parse only the one that is actually used
+    http_url_raw = res.get("http_url_named") or res.get("http_url")
+    http_url = URL(http_url_raw) if http_url_raw else _EMPTY_URL
     internal_hostname = res.get("internal_hostname", None)
     internal_hostname_named = res.get("internal_hostname_named", None)
     restart_policy = JobRestartPolicy(res.get("restart_policy", JobRestartPolicy.NEVER))
@@ -1074,7 +1079,7 @@ def _job_description_from_api(res: dict[str, Any], parse: Parser) -> JobDescript
         name=name,
         tags=tags,
         description=description,
-        http_url=http_url_named or http_url,
+        http_url=http_url,
         internal_hostname=internal_hostname,
         internal_hostname_named=internal_hostname_named,
         uri=URL(res["uri"]),
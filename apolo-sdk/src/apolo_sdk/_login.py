@@ -46,7 +46,7 @@ JWT_IDENTITY_CLAIM_OPTIONS = ("identity", JWT_IDENTITY_CLAIM)
 
 class AuthCode:
     def __init__(self, callback_url: URL | None = None) -> None:
-        self._future: asyncio.Future[str] = asyncio.Future()
+        self._future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
 
         self._verifier = urlsafe_unpadded_b64encode(secrets.token_bytes(32))
         digest = hashlib.sha256(self._verifier.encode()).digest()
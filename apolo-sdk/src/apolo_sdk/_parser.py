@@ -1,3 +1,4 @@
+import functools
 import os
 from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
@@ -155,15 +156,15 @@ class Parser(metaclass=NoPublicConstructor):
         )
 
     def _get_image_parser(self, cluster_name: str | None = None) -> _ImageNameParser:
-        registry = {
-            cluster.name: cluster.registry_url
+        registry = tuple(
+            (cluster.name, cluster.registry_url)
             for cluster in self._config.clusters.values()
-        }
-        return _ImageNameParser(
-            default_cluster=cluster_name or self._config.cluster_name,
-            default_org=self._config.org_name,
-            default_project=self._config.project_name_or_raise,
-            registry_urls=registry,
+        )
+        return _make_image_parser(
+            cluster_name or self._config.cluster_name,
+            self._config.org_name,
+            self._config.project_name_or_raise,
+            registry,
         )
 
     def local_image(self, image: str) -> LocalImage:
@@ -343,6 +344,22 @@ class Parser(metaclass=NoPublicConstructor):
         return ret
 
 
+@functools.lru_cache(maxsize=16)
+def _make_image_parser(
+    default_cluster: str,
+    default_org: str,
+    default_project: str,
+    registry_urls: tuple[tuple[str, URL], ...],
+) -> _ImageNameParser:
+    # The parser is immutable, share it between calls with the same config
+    return _ImageNameParser(
+        default_cluster=default_cluster,
+        default_org=default_org,
+        default_project=default_project,
+        registry_urls=dict(registry_urls),
+    )
+
+
 def _read_lines(env_file: str) -> Iterator[str]:
     with open(env_file, encoding="utf-8-sig") as ef:
         lines = ef.read().splitlines()
@@ -1,4 +1,5 @@
 import enum
+import functools
 import re
 from dataclasses import dataclass
 
@@ -8,6 +9,12 @@ from ._rewrite import rewrite_module
 from ._url_utils import _check_uri, _check_uri_str
 from ._utils import RELOGIN_TEXT
 
+# See https://docs.docker.com/reference/cli/docker/image/tag/
+_IMAGE_NAME_RE = re.compile(
+    r"(?:[a-z0-9]+(?:[._-][a-z0-9]+)*/)*[a-z0-9]+(?:[._-][a-z0-9]+)*"
+)
+_IMAGE_TAG_RE = re.compile(r"[a-zA-Z0-9_]+[a-zA-Z0-9_.-]*")
+
 
 @rewrite_module
 class TagOption(enum.Enum):
@@ -304,22 +311,23 @@ class _ImageNameParser:
         if image.endswith(":") or image.startswith(":"):
             # case `ubuntu:`, `:latest`
             raise ValueError("empty name or empty tag")
-        colon_count = image.count(":")
-        if colon_count == 0:
+        first = image.find(":")
+        second = image.find(":", first + 1) if first >= 0 else -1
+        if first < 0:
             # case `ubuntu`
             name, tag = image, default_tag
-        elif colon_count == 1:
+        elif second < 0:
             # case `ubuntu:latest`
-            name, tag = image.split(":")
+            name, tag = image[:first], image[first + 1 :]
             if "/" in tag:
                 # case `localhost:5000/ubuntu`
                 name, tag = image, default_tag
-        elif colon_count == 2:
+        elif image.find(":", second + 1) < 0:
             # case `localhost:9000/owner/ubuntu:latest`
             if "/" not in image:
                 # case `localhost:9000:latest`
                 raise ValueError("too many tags")
-            name, tag = image.rsplit(":", 1)
+            name, tag = image[:second], image[second + 1 :]
         else:
             raise ValueError("too many tags")
         if "/" in name:
@@ -328,10 +336,7 @@ class _ImageNameParser:
             name_no_repo = name
         if not name_no_repo:
             raise ValueError("no image name specified")
-        if not re.fullmatch(
-            r"(?:[a-z0-9]+(?:[._-][a-z0-9]+)*/)*[a-z0-9]+(?:[._-][a-z0-9]+)*",
-            name_no_repo,
-        ):
+        if not _IMAGE_NAME_RE.fullmatch(name_no_repo):
             raise ValueError(
                 "invalid image name. Docker specifies it to be the following:\n"
                 "Name components may contain lowercase letters, digits and "
@@ -342,7 +347,7 @@ class _ImageNameParser:
         if tag:
             if len(tag) > 128:
                 raise ValueError("tag is to long")
-            if not re.fullmatch(r"[a-zA-Z0-9_]+[a-zA-Z0-9_.-]*", tag):
+            if not _IMAGE_TAG_RE.fullmatch(tag):
                 raise ValueError(
                     "invalid tag. Docker specifies it to be the following:\n"
                     "A tag name must be valid ASCII and may contain lowercase "
@@ -360,6 +365,7 @@ class Tag:
     size: int | None = None
 
 
+@functools.lru_cache(maxsize=32)
 def _get_url_authority(url: URL) -> str:
     assert url.host is not None
     port = url.explicit_port
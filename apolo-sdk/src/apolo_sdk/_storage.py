@@ -385,20 +385,13 @@ class Storage(metaclass=NoPublicConstructor):
             res = await resp.json()
             return _disk_usage_from_api(cluster_name, org_name_val, uri, res)
 
-    def _create_disk_usage_uri(
-        self, cluster_name: str | None, org_name: str | None
-    ) -> URL:
+    def _create_disk_usage_uri(self, cluster_name: str, org_name: str | None) -> URL:
+        path = f"/{self._config.project_name_or_raise}"
         if org_name:
-            uri = self._normalize_uri(
-                URL(
-                    f"storage://{cluster_name}/{org_name}"
-                    f"/{self._config.project_name_or_raise}"
-                )
-            )
-        else:
-            uri = self._normalize_uri(
-                URL(f"storage://{cluster_name}/{self._config.project_name_or_raise}")
-            )
+            path = f"/{org_name}{path}"
+        uri = self._normalize_uri(
+            URL.build(scheme="storage", host=cluster_name, path=path)
+        )
         assert uri.host is not None
         return uri
 
@@ -701,7 +694,7 @@ class Storage(metaclass=NoPublicConstructor):
         if ignore_file_names:
             for child in folder:
                 if child.name in ignore_file_names and child.is_file():
-                    log.debug(f"Load ignore file {rel_path}{child.name}")
+                    log.debug("Load ignore file %s%s", rel_path, child.name)
                     file_filter = FileFilter(filter)
                     file_filter.read_from_file(child, prefix=rel_path)
                     filter = file_filter.match
@@ -712,7 +705,7 @@ class Storage(metaclass=NoPublicConstructor):
             if child.is_dir():
                 child_rel_path += "/"
             if not await filter(child_rel_path):
-                log.debug(f"Skip {child_rel_path}")
+                log.debug("Skip %s", child_rel_path)
                 continue
             if child.is_file():
                 offset: int | None = 0
@@ -892,7 +885,7 @@ class Storage(metaclass=NoPublicConstructor):
             if child.is_dir():
                 child_rel_path += "/"
             if not await filter(child_rel_path):
-                log.debug(f"Skip {child_rel_path}")
+                log.debug("Skip %s", child_rel_path)
                 continue
             if child.is_file():
                 offset: int | None = 0
@@ -1075,7 +1068,7 @@ def load_parent_ignore_files(
     for name in ignore_file_names:
         config_path = path / name
         if config_path.exists():
-            log.debug(f"Load ignore file {str(config_path)!r}")
+            log.debug("Load ignore file %r", str(config_path))
             file_filter = FileFilter(filter)
             file_filter.read_from_file(config_path, "", rel_path)
             filter = file_filter.match
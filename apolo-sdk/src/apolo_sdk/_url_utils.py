@@ -144,9 +144,10 @@ def normalize_local_path_uri(uri: URL) -> URL:
     if uri.path.startswith("~"):
         raise ValueError(f"Cannot expand user for {uri}")
     path = _extract_path(uri)
-    # path.absolute() does not work with relative path with disk
-    # See https://bugs.python.org/issue36305
-    path = Path(path.anchor).resolve() / path
+    if not path.is_absolute():
+        # path.absolute() does not work with relative path with disk
+        # See https://bugs.python.org/issue36305
+        path = Path(path.anchor).resolve() / path
     ret = URL(path.as_uri())
     while ret.path.startswith("//"):
         ret = ret.with_path(ret.path[1:])
@@ -163,19 +164,21 @@ def _extract_path(uri: URL) -> Path:
 
 
 def _check_uri(uri: URL) -> None:
-    if uri.fragment:
+    # Raw accessors return the already split strings without decoding them
+    # or building a query MultiDict, only emptiness matters here.
+    if uri.raw_fragment:
         raise ValueError(
             f"Fragment part is not allowed in {uri.scheme} URI. "
             f"Use '%23' to quote '#' in path."
         )
-    if uri.query:
+    if uri.raw_query_string:
         raise ValueError(
             f"Query part is not allowed in {uri.scheme} URI. "
             f"Use '%3F' to quote '?' in path."
         )
-    if uri.user is not None:
+    if uri.raw_user is not None:
         raise ValueError(f"User is not allowed in {uri.scheme} URI.")
-    if uri.password is not None:
+    if uri.raw_password is not None:
         raise ValueError(f"Password is not allowed in {uri.scheme} URI")
     if uri.port is not None:
         raise ValueError(f"Port is not allowed in {uri.scheme} URI")
@@ -1,4 +1,7 @@
 from collections.abc import Callable
+from unittest import mock
+
+import pytest
 
 from apolo_sdk import Client
 
@@ -17,3 +20,16 @@ async def test_client_double_closing(make_client: _MakeClient) -> None:
     assert client._closed
     await client.close()
     assert client._closed
+
+
+async def test_client_close_releases_session_on_error(
+    make_client: _MakeClient,
+) -> None:
+    client = make_client("http://example.com")
+    with mock.patch.object(
+        client._core, "close", side_effect=RuntimeError("cleanup failed")
+    ):
+        with pytest.raises(RuntimeError, match="cleanup failed"):
+            await client.close()
+    assert client._closed
+    assert client._session.closed
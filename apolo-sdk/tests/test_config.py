@@ -153,6 +153,27 @@ async def test_get_user_config_from_global(make_client: _MakeClient) -> None:
         }
 
 
+async def test_get_user_config_cached(make_client: _MakeClient) -> None:
+    async with make_client("https://example.com") as client:
+        client.config._path.mkdir(parents=True, exist_ok=True)
+        global_conf = client.config._path / "user.toml"
+        global_conf.write_text(toml.dumps({"alias": {"pss": {"cmd": "job ps"}}}))
+        with mock.patch("toml.load", wraps=toml.load) as load:
+            await client.config.get_user_config()
+            assert await client.config.get_user_config() == {
+                "alias": {"pss": {"cmd": "job ps"}}
+            }
+            assert load.call_count == 1
+
+            global_conf.write_text(
+                toml.dumps({"alias": {"pss": {"cmd": "job ps --short"}}})
+            )
+            assert await client.config.get_user_config() == {
+                "alias": {"pss": {"cmd": "job ps --short"}}
+            }
+            assert load.call_count == 2
+
+
 async def test_get_user_config_from_local(
     monkeypatch: Any, tmp_path: Path, make_client: _MakeClient
 ) -> None:
@@ -1,7 +1,8 @@
-import asyncio
+import contextlib
 import errno
 import json
 import os
+import time
 from collections.abc import AsyncIterator, Callable
 from filecmp import dircmp
 from pathlib import Path
@@ -1810,6 +1811,44 @@ async def test_storage_download_regular_file_to_existing_file(
     assert downloaded == expected
 
 
+async def test_storage_download_interrupted_continue(
+    storage_server: Any, make_client: _MakeClient, tmp_path: Path, storage_path: Path
+) -> None:
+    content = bytes(range(256)) * 64
+    storage_file = storage_path / "file.txt"
+    storage_file.write_bytes(content)
+    local_file = tmp_path / "file.txt"
+    src = URL("storage:file.txt")
+    dst = URL(local_file.as_uri())
+
+    sizes_on_disk = []
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        yield content[:1000]
+        # What a hard kill (SIGKILL, power loss) would leave behind
+        sizes_on_disk.append(local_file.stat().st_size)
+        raise RuntimeError("interrupted")
+
+    @contextlib.asynccontextmanager
+    async def _open(uri: URL, offset: int = 0) -> AsyncIterator[Any]:
+        yield _chunks()
+
+    async with make_client(storage_server.make_url("/")) as client:
+        with mock.patch.object(client.storage, "open", _open):
+            with pytest.raises(RuntimeError, match="interrupted"):
+                await client.storage.download_file(src, dst)
+
+    # The file never grows past the received bytes, so --continue always
+    # sees a partial file
+    assert sizes_on_disk[0] <= 1000
+    assert local_file.read_bytes() == content[:1000]
+
+    async with make_client(storage_server.make_url("/")) as client:
+        await client.storage.download_file(src, dst, continue_=True)
+
+    assert local_file.read_bytes() == content
+
+
 async def test_storage_download_regular_file_to_dir(
     storage_server: Any, make_client: _MakeClient, tmp_path: Path, storage_path: Path
 ) -> None:
@@ -1907,6 +1946,11 @@ async def test_storage_download_dir_slash_ending(
     assert not calc_diff(diff)
 
 
+def _make_older(path: Path) -> None:
+    hour_ago = time.time() - 3600
+    os.utime(path, (hour_ago, hour_ago))
+
+
 @pytest.fixture
 def zero_time_threshold(monkeypatch: Any) -> None:
     import apolo_sdk._storage
@@ -1941,8 +1985,8 @@ async def test_storage_upload_file_update(
     assert storage_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(5)
     storage_file.write_bytes(b"old")
+    _make_older(local_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.upload_file(src, dst, update=True)
     assert storage_file.read_bytes() == b"old"
@@ -1975,8 +2019,8 @@ async def test_storage_upload_file_continue(
     assert storage_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(5)
     storage_file.write_bytes(b"old content")
+    _make_older(local_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.upload_file(src, dst, continue_=True)
     assert storage_file.read_bytes() == b"old content"
@@ -2022,8 +2066,8 @@ async def test_storage_upload_dir_update(
     assert storage_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(5)
     storage_file.write_bytes(b"old")
+    _make_older(local_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.upload_dir(src, dst, update=True)
     assert storage_file.read_bytes() == b"old"
@@ -2058,8 +2102,8 @@ async def test_storage_upload_dir_continue(
     assert storage_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(5)
     storage_file.write_bytes(b"old content")
+    _make_older(local_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.upload_dir(src, dst, continue_=True)
     assert storage_file.read_bytes() == b"old content"
@@ -2103,8 +2147,8 @@ async def test_storage_download_file_update(
     assert local_file.read_bytes() == b"new content"
 
     # Destination file is newer
-    await asyncio.sleep(2)
     local_file.write_bytes(b"old")
+    _make_older(storage_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.download_file(src, dst, update=True)
     assert local_file.read_bytes() == b"old"
@@ -2137,8 +2181,8 @@ async def test_storage_download_file_continue(
     assert local_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(2)
     local_file.write_bytes(b"old content")
+    _make_older(storage_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.download_file(src, dst, continue_=True)
     assert local_file.read_bytes() == b"old content"
@@ -2184,8 +2228,8 @@ async def test_storage_download_dir_update(
     assert local_file.read_bytes() == b"new content"
 
     # Destination file is newer
-    await asyncio.sleep(2)
     local_file.write_bytes(b"old")
+    _make_older(storage_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.download_dir(src, dst, update=True)
     assert local_file.read_bytes() == b"old"
@@ -2219,8 +2263,8 @@ async def test_storage_download_dir_continue(
     assert local_file.read_bytes() == b"new content"
 
     # Destination file is newer, same size
-    await asyncio.sleep(2)
     local_file.write_bytes(b"old content")
+    _make_older(storage_file)
     async with make_client(storage_server.make_url("/")) as client:
         await client.storage.download_dir(src, dst, continue_=True)
     assert local_file.read_bytes() == b"old content"
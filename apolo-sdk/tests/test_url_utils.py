@@ -219,13 +219,51 @@ async def test_uri_from_cli__blob__fail(uri: str) -> None:
         uri_from_cli(uri, "u", "c", None, allowed_schemes=("blob",))
 
 
-async def test_normalize_storage_path_uri_no_path(client: Client) -> None:
-    url = URL("storage:")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
+@pytest.mark.parametrize(
+    "uri_str,org_name,expected",
+    [
+        ("storage:", None, "storage://test-cluster/user"),
+        ("storage:file.txt", None, "storage://test-cluster/user/file.txt"),
+        (
+            "storage:file.txt",
+            "test-org",
+            "storage://test-cluster/test-org/user/file.txt",
+        ),
+        (
+            "storage:path/to/file.txt",
+            None,
+            "storage://test-cluster/user/path/to/file.txt",
+        ),
+        (
+            "storage:path/to/file.txt",
+            "test-org",
+            "storage://test-cluster/test-org/user/path/to/file.txt",
+        ),
+        ("storage:/path/to/file.txt", None, "storage://test-cluster/path/to/file.txt"),
+        (
+            "storage:/path/to/file.txt",
+            "test-org",
+            "storage://test-cluster/test-org/path/to/file.txt",
+        ),
+        ("storage://path/to/file.txt", None, "storage://path/to/file.txt"),
+        (
+            "storage:///path/to/file.txt",
+            None,
+            "storage://test-cluster/path/to/file.txt",
+        ),
+        (
+            "storage:////path/to/file.txt",
+            None,
+            "storage://test-cluster/path/to/file.txt",
+        ),
+    ],
+)
+def test_normalize_storage_path_uri(
+    uri_str: str, org_name: str | None, expected: str
+) -> None:
+    url = normalize_storage_path_uri(URL(uri_str), "user", "test-cluster", org_name)
     assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/user"
-    assert str(url) == "storage://test-cluster/user"
+    assert str(url) == expected
 
 
 async def test_normalize_local_path_uri_no_path(pwd: Path) -> None:
@@ -236,24 +274,6 @@ async def test_normalize_local_path_uri_no_path(pwd: Path) -> None:
     assert _extract_path(url) == pwd
 
 
-async def test_normalize_storage_path_uri_no_slashes(client: Client) -> None:
-    url = URL("storage:file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/user/file.txt"
-    assert str(url) == "storage://test-cluster/user/file.txt"
-
-
-async def test_normalize_storage_path_uri_no_slashes_with_org(client: Client) -> None:
-    url = URL("storage:file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", "test-org")
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/test-org/user/file.txt"
-    assert str(url) == "storage://test-cluster/test-org/user/file.txt"
-
-
 async def test_normalize_local_path_uri_no_slashes(pwd: Path) -> None:
     url = URL("file:file.txt")
     url = normalize_local_path_uri(url)
@@ -262,26 +282,6 @@ async def test_normalize_local_path_uri_no_slashes(pwd: Path) -> None:
     assert _extract_path(url) == pwd / "file.txt"
 
 
-async def test_normalize_storage_path_uri__0_slashes_relative(client: Client) -> None:
-    url = URL("storage:path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/user/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/user/path/to/file.txt"
-
-
-async def test_normalize_storage_path_uri__0_slashes_relative_with_org(
-    client: Client,
-) -> None:
-    url = URL("storage:path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", "test-org")
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/test-org/user/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/test-org/user/path/to/file.txt"
-
-
 async def test_normalize_local_path_uri__0_slashes_relative(pwd: Path) -> None:
     url = URL("file:path/to/file.txt")
     url = normalize_local_path_uri(url)
@@ -290,26 +290,6 @@ async def test_normalize_local_path_uri__0_slashes_relative(pwd: Path) -> None:
     assert _extract_path(url) == pwd / "path/to/file.txt"
 
 
-async def test_normalize_storage_path_uri__1_slash_absolute(client: Client) -> None:
-    url = URL("storage:/path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/path/to/file.txt"
-
-
-async def test_normalize_storage_path_uri__1_slash_absolute_with_org(
-    client: Client,
-) -> None:
-    url = URL("storage:/path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", "test-org")
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/test-org/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/test-org/path/to/file.txt"
-
-
 async def test_normalize_local_path_uri__1_slash_absolute(pwd: Path) -> None:
     url = URL("file:/path/to/file.txt")
     url = normalize_local_path_uri(url)
@@ -318,15 +298,6 @@ async def test_normalize_local_path_uri__1_slash_absolute(pwd: Path) -> None:
     assert _extract_path(url) == Path(pwd.drive + "/path/to/file.txt")
 
 
-async def test_normalize_storage_path_uri__2_slashes(client: Client) -> None:
-    url = URL("storage://path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "path"
-    assert url.path == "/to/file.txt"
-    assert str(url) == "storage://path/to/file.txt"
-
-
 async def test_normalize_local_path_uri__2_slashes(pwd: Path) -> None:
     url = URL("file://path/to/file.txt")
     with pytest.raises(
@@ -335,15 +306,6 @@ async def test_normalize_local_path_uri__2_slashes(pwd: Path) -> None:
         url = normalize_local_path_uri(url)
 
 
-async def test_normalize_storage_path_uri__3_slashes_relative(client: Client) -> None:
-    url = URL("storage:///path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/path/to/file.txt"
-
-
 async def test_normalize_local_path_uri__3_slashes_relative(pwd: Path) -> None:
     url = URL("file:///path/to/file.txt")
     url = normalize_local_path_uri(url)
@@ -352,15 +314,6 @@ async def test_normalize_local_path_uri__3_slashes_relative(pwd: Path) -> None:
     assert _extract_path(url) == Path(pwd.drive + "/path/to/file.txt")
 
 
-async def test_normalize_storage_path_uri__4_slashes_relative(client: Client) -> None:
-    url = URL("storage:////path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
-    assert url.scheme == "storage"
-    assert url.host == "test-cluster"
-    assert url.path == "/path/to/file.txt"
-    assert str(url) == "storage://test-cluster/path/to/file.txt"
-
-
 @pytest.mark.skipif(sys.platform == "win32", reason="Doesn't work on Windows")
 async def test_normalize_local_path_uri__4_slashes_relative() -> None:
     url = URL("file:////path/to/file.txt")
@@ -390,12 +343,10 @@ async def test_normalize_storage_path_uri__fail(uri_str: str) -> None:
         normalize_storage_path_uri(uri, "test-user", "test-cluster", None)
 
 
-async def test_normalize_storage_path_uri__tilde_in_relative_path(
-    client: Client,
-) -> None:
+def test_normalize_storage_path_uri__tilde_in_relative_path() -> None:
     url = URL("storage:~/path/to/file.txt")
     with pytest.raises(ValueError, match=".*Cannot expand user.*"):
-        normalize_storage_path_uri(url, client.username, "test-cluster", None)
+        normalize_storage_path_uri(url, "user", "test-cluster", None)
 
 
 async def test_normalize_local_path_uri__tilde_in_relative_path(
@@ -406,11 +357,9 @@ async def test_normalize_local_path_uri__tilde_in_relative_path(
         normalize_local_path_uri(url)
 
 
-async def test_normalize_storage_path_uri__tilde_in_relative_path_2(
-    client: Client,
-) -> None:
+def test_normalize_storage_path_uri__tilde_in_relative_path_2() -> None:
     url = URL("storage:./~/path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
+    url = normalize_storage_path_uri(url, "user", "test-cluster", None)
     assert url.scheme == "storage"
     assert url.host == "test-cluster"
     assert url.path == "/user/~/path/to/file.txt"
@@ -428,11 +377,9 @@ async def test_normalize_local_path_uri__tilde_in_relative_path_2(
     assert str(url) == (pwd / "~/path/to/file.txt").as_uri().replace("%7E", "~")
 
 
-async def test_normalize_storage_path_uri__tilde_in_relative_path_3(
-    client: Client,
-) -> None:
+def test_normalize_storage_path_uri__tilde_in_relative_path_3() -> None:
     url = URL("storage:path/to~file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
+    url = normalize_storage_path_uri(url, "user", "test-cluster", None)
     assert url.scheme == "storage"
     assert url.host == "test-cluster"
     assert url.path == "/user/path/to~file.txt"
@@ -450,12 +397,10 @@ async def test_normalize_local_path_uri__tilde_in_relative_path_3(
     assert str(url) == (pwd / "path/to~file.txt").as_uri().replace("%7E", "~")
 
 
-async def test_normalize_storage_path_uri__tilde_in_absolute_path(
-    client: Client,
-) -> None:
+def test_normalize_storage_path_uri__tilde_in_absolute_path() -> None:
     url = URL("storage:/~/path/to/file.txt")
     with pytest.raises(ValueError, match=r"Cannot expand user for "):
-        normalize_storage_path_uri(url, client.username, "test-cluster", None)
+        normalize_storage_path_uri(url, "user", "test-cluster", None)
 
 
 async def test_normalize_local_path_uri__tilde_in_absolute_path(
@@ -469,15 +414,13 @@ async def test_normalize_local_path_uri__tilde_in_absolute_path(
     assert str(url) == (pwd / "/~/path/to/file.txt").as_uri().replace("%7E", "~")
 
 
-async def test_normalize_storage_path_uri__tilde_in_host(client: Client) -> None:
+def test_normalize_storage_path_uri__tilde_in_host() -> None:
     url = URL("storage://~/path/to/file.txt")
     with pytest.raises(ValueError, match=r"Cannot expand user for "):
-        normalize_storage_path_uri(url, client.username, "test-cluster", None)
+        normalize_storage_path_uri(url, "user", "test-cluster", None)
 
 
-async def test_normalize_local_path_uri__tilde_in_host(
-    client: Client, pwd: Path
-) -> None:
+def test_normalize_local_path_uri__tilde_in_host(pwd: Path) -> None:
     url = URL("file://~/path/to/file.txt")
     with pytest.raises(
         ValueError, match=f"Host part is not allowed in file URI, found '~'"
@@ -485,10 +428,10 @@ async def test_normalize_local_path_uri__tilde_in_host(
         url = normalize_local_path_uri(url)
 
 
-async def test_normalize_storage_path_uri__bad_scheme(client: Client) -> None:
+def test_normalize_storage_path_uri__bad_scheme() -> None:
     with pytest.raises(ValueError, match="Invalid storage scheme 'other:'"):
         url = URL("other:path/to/file.txt")
-        normalize_storage_path_uri(url, client.username, "test-cluster", None)
+        normalize_storage_path_uri(url, "user", "test-cluster", None)
 
 
 async def test_normalize_local_path_uri__bad_scheme() -> None:
@@ -500,9 +443,9 @@ async def test_normalize_local_path_uri__bad_scheme() -> None:
 # The tests below check that f(f(x)) == f(x) where f is a path normalization function
 
 
-async def test_normalize_storage_path_uri__no_slash__double(client: Client) -> None:
+def test_normalize_storage_path_uri__no_slash__double() -> None:
     url = URL("storage:path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
+    url = normalize_storage_path_uri(url, "user", "test-cluster", None)
     assert url.scheme == "storage"
     assert url.host == "test-cluster"
     assert url.path == "/user/path/to/file.txt"
@@ -517,10 +460,10 @@ async def test_normalize_local_path_uri__no_slash__double(pwd: Path) -> None:
     assert _extract_path(url) == pwd / "path/to/file.txt"
 
 
-async def test_normalize_storage_path_uri__tilde_slash__double(client: Client) -> None:
+def test_normalize_storage_path_uri__tilde_slash__double() -> None:
     url = URL("storage:~/path/to/file.txt")
     with pytest.raises(ValueError, match=".*Cannot expand user.*"):
-        normalize_storage_path_uri(url, client.username, "test-cluster", None)
+        normalize_storage_path_uri(url, "user", "test-cluster", None)
 
 
 async def test_normalize_local_path_uri__tilde_slash__double() -> None:
@@ -529,9 +472,9 @@ async def test_normalize_local_path_uri__tilde_slash__double() -> None:
         normalize_local_path_uri(url)
 
 
-async def test_normalize_storage_path_uri__3_slashes__double(client: Client) -> None:
+def test_normalize_storage_path_uri__3_slashes__double() -> None:
     url = URL("storage:///path/to/file.txt")
-    url = normalize_storage_path_uri(url, client.username, "test-cluster", None)
+    url = normalize_storage_path_uri(url, "user", "test-cluster", None)
     assert url.scheme == "storage"
     assert url.host == "test-cluster"
     assert url.path == "/path/to/file.txt"